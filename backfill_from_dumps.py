@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'reddit-stock-tracker-backend'))
+
+from app.services.data_processor import DataProcessor
+from app.services.dump_collector import DumpCollector
+from app.services.ticker_extractor import TickerExtractor
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Backfill mention counts from Pushshift-style NDJSON dumps"
+    )
+    parser.add_argument("paths", nargs="+", help="dump files or glob patterns")
+    parser.add_argument("--start", help="first ISO date to include")
+    parser.add_argument("--end", help="ISO date to stop before")
+    parser.add_argument("--subreddits", nargs="+", help="defaults to the app's list")
+    parser.add_argument("--force", action="store_true",
+                        help="replay files already backfilled over this range")
+    return parser.parse_args()
+
+
+def _overlaps(a: list, b: list) -> bool:
+    """Whether two [start, end) ranges overlap; None is unbounded"""
+    return (a[0] is None or b[1] is None or a[0] < b[1]) and (
+        b[0] is None or a[1] is None or b[0] < a[1]
+    )
+
+
+def _backfilled_ranges(processor: DataProcessor, path: str) -> list:
+    value = processor.store.get_meta(f"backfill:{os.path.abspath(path)}")
+    return json.loads(value) if value else []
+
+
+def backfill(
+    processor: DataProcessor,
+    extractor,
+    paths: List[str],
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    subreddits: Optional[List[str]] = None,
+    force: bool = False,
+) -> int:
+    """Replay each dump into processor's store; returns the items consumed.
+
+    Counts are added, and the item dedup does not outlive this process, so
+    replaying a dump into a store that already holds it would count it
+    twice. Each file's replayed range is recorded in the store once the
+    file has been read to the end, and overlapping replays are skipped
+    unless force is set. A file that fails mid-replay is not recorded;
+    clear its partial counts before replaying it again.
+    """
+    item_count = 0
+    for path in DumpCollector(paths, subreddits).paths:
+        ranges = _backfilled_ranges(processor, path)
+        if not force and any(_overlaps(r, [start, end]) for r in ranges):
+            print(f"Skipping {path}: already backfilled over this range")
+            continue
+
+        replay = DumpCollector([path], subreddits)
+        item_count += processor.process_reddit_data(
+            replay.iter_items(start, end), extractor
+        )
+        if path in replay.failed_sources:
+            print(f"Not recording {path} as backfilled: it was not fully read")
+            continue
+        processor.store.set_meta(
+            f"backfill:{os.path.abspath(path)}", json.dumps(ranges + [[start, end]])
+        )
+    return item_count
+
+
+def main():
+    args = parse_args()
+    start = int(datetime.fromisoformat(args.start).timestamp()) if args.start else None
+    end = int(datetime.fromisoformat(args.end).timestamp()) if args.end else None
+
+    # Point MENTION_STORE / MENTION_DB_PATH at the store to fill
+    processor = DataProcessor()
+    extractor = TickerExtractor()
+
+    print(f"📦 Backfilling from {len(DumpCollector(args.paths).paths)} dump file(s)")
+    started = time.perf_counter()
+    item_count = backfill(
+        processor, extractor, args.paths, start, end, args.subreddits, args.force
+    )
+    elapsed = time.perf_counter() - started
+    extractor.validation_cache.save()
+
+    print(f"\n✅ {item_count} items in {elapsed:.2f}s "
+          f"({item_count / elapsed if elapsed else 0:,.0f} items/s)")
+    print(f"Dates stored: {len(processor.get_all_dates())}")
+    processor.close()
+
+
+if __name__ == "__main__":
+    main()
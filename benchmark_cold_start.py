@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+import statistics
+import subprocess
+
+BACKEND_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'reddit-stock-tracker-backend'
+)
+
+# Runs in a fresh interpreter so every sample pays the full import cost
+CHILD_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+import app.main
+
+imported = time.perf_counter()
+with TestClient(app.main.app) as client:
+    started = time.perf_counter()
+    client.get("/healthz").raise_for_status()
+    live = time.perf_counter()
+    client.get("/api/trending").raise_for_status()
+    first = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - start,
+    "startup": started - imported,
+    "healthz": live - start,
+    "first_trending": first - start,
+}))
+"""
+
+
+def run_once(env: dict) -> dict:
+    """Start the app in a child process and time it up to the first request"""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(label: str, runs: int, **overrides):
+    env = dict(os.environ, STARTUP_COLLECTION="0", PYTHONWARNINGS="ignore")
+    env.update(overrides)
+    samples = [run_once(env) for _ in range(runs)]
+
+    print(f"\n{label}")
+    for stage in ("import", "startup", "healthz", "first_trending"):
+        values = [sample[stage] * 1000 for sample in samples]
+        print(f"  {stage:<15} median {statistics.median(values):8.1f} ms   "
+              f"max {max(values):8.1f} ms")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print("⏱️  Cold start: time from interpreter start to first response")
+    print(f"Runs per configuration: {runs} (startup collection disabled)")
+
+    benchmark("Mock data (default)", runs)
+    benchmark("No mock data", runs, MOCK_DATA="0")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'reddit-stock-tracker-backend'))
+
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import DictMentionStore
+from app.services.parallel_extraction import ExtractionPool
+from app.services.reddit_item import RedditItem
+from app.services.ticker_extractor import TickerExtractor
+from benchmark_ticker_extraction import build_corpus
+
+START_UTC = 1700000000
+
+
+def build_items(count: int) -> list:
+    """Seeded corpus spread over 30 days, one item every ~26 seconds"""
+    step = 30 * 24 * 3600 // count
+    return [
+        RedditItem(format(i, "x"), "wallstreetbets", START_UTC + i * step, body=text)
+        for i, text in enumerate(build_corpus(count, 40))
+    ]
+
+
+def run(items: list, workers: int, engine: str, batch_size: int) -> tuple:
+    processor = DataProcessor(DictMentionStore())
+    if workers > 1:
+        processor.extraction_pool = ExtractionPool(workers)
+        # Spawn the workers outside the timed region
+        processor.extraction_pool.count([("warmup", "AAPL")], TickerExtractor(engine))
+
+    start = time.perf_counter()
+    processor.process_reddit_data(items, TickerExtractor(engine), batch_size)
+    elapsed = time.perf_counter() - start
+
+    snapshot = processor.store.counts_by_date()
+    processor.close()
+    return elapsed, snapshot
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    engine = sys.argv[2] if len(sys.argv) > 2 else "regex"
+    batch_size = 50000
+    items = build_items(count)
+
+    print(f"⚙️  Parallel extraction: {count} items, {engine} engine, "
+          f"batch size {batch_size}, {os.cpu_count()} CPU(s)")
+
+    baseline = None
+    serial_elapsed = None
+    for workers in (1, 2, 4, 8):
+        elapsed, snapshot = run(items, workers, engine, batch_size)
+        if baseline is None:
+            baseline, serial_elapsed = snapshot, elapsed
+        identical = "identical" if snapshot == baseline else "MISMATCH"
+        print(f"  workers={workers}: {elapsed:6.2f}s  "
+              f"{count / elapsed:>9,.0f} items/s  "
+              f"speedup {serial_elapsed / elapsed:4.2f}x  ({identical})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'reddit-stock-tracker-backend'))
+
+from app.services.reddit_collector import RedditCollector
+from app.services.watermarks import WatermarkStore
+
+ITEMS_PER_SOURCE = {"submission": 300, "comment": 1500}
+SOURCE_SPAN = 30 * 24 * 3600
+LATENCY = 0.05  # seconds added to every response, like a remote API
+
+
+def fake_items(kind: str, subreddit: str, now: int, count: int, span: int,
+               prefix: str = "") -> list:
+    """Evenly spaced items for one (subreddit, kind) source, newest first"""
+    step = span // count
+    text_field = "title" if kind == "submission" else "body"
+    return [
+        {
+            "id": f"{prefix}{subreddit[:3]}{kind[0]}{i}",
+            "subreddit": subreddit,
+            "created_utc": now - i * step,
+            text_field: "Loading up on $TSLA and NVDA calls",
+        }
+        for i in range(count)
+    ]
+
+
+class FakePushshiftHandler(BaseHTTPRequestHandler):
+    """Just enough of the Pushshift search API for pmaw's time slicing"""
+
+    sources = {}
+    request_count = 0
+
+    def do_GET(self):
+        FakePushshiftHandler.request_count += 1
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        kind = "submission" if "/submission/" in url.path else "comment"
+        items = self.sources.get((params.get("subreddit"), kind), [])
+
+        since = int(float(params.get("since", 0)))
+        until = int(float(params.get("until", time.time())))
+        size = int(params.get("size", 100))
+        matching = [item for item in items if since <= item["created_utc"] < until]
+
+        body = json.dumps({
+            "data": matching[:size],
+            "metadata": {
+                "es": {
+                    "hits": {"total": {"value": len(matching)}},
+                    "_shards": {"successful": 1, "total": 1},
+                },
+                "es_query": {"query": {"bool": {"must": [{"bool": {"must": [
+                    {"range": {"created_utc": {"gte": since * 1000}}},
+                    {"range": {"created_utc": {"lt": until * 1000}}},
+                ]}}]}}},
+            },
+        }).encode()
+
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(subreddits: list) -> ThreadingHTTPServer:
+    now = int(time.time()) - 3600
+    FakePushshiftHandler.sources = {
+        (subreddit, kind): fake_items(kind, subreddit, now, count, SOURCE_SPAN)
+        for subreddit in subreddits
+        for kind, count in ITEMS_PER_SOURCE.items()
+    }
+    ThreadingHTTPServer.request_queue_size = 128
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakePushshiftHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def post_new_activity(count: int):
+    """Add count newer items to every source, as if an hour had passed"""
+    now = int(time.time()) - 60
+    for (subreddit, kind), items in FakePushshiftHandler.sources.items():
+        items[:0] = fake_items(kind, subreddit, now, count, 3000, prefix="new")
+
+
+def run_collection(collector: RedditCollector) -> tuple:
+    FakePushshiftHandler.request_count = 0
+    start = time.perf_counter()
+    items = collector.collect_recent_data(30)
+    collector.watermarks.commit()
+    return time.perf_counter() - start, len(items), FakePushshiftHandler.request_count
+
+
+def make_collector(base_url: str, max_workers: int = 8) -> RedditCollector:
+    collector = RedditCollector(
+        base_url=base_url,
+        max_workers=max_workers,
+        rate_limit=100000,
+        watermarks=WatermarkStore(),
+    )
+    collector.limits = dict(ITEMS_PER_SOURCE)
+    return collector
+
+
+def main():
+    subreddits = RedditCollector().subreddits
+    server = start_server(subreddits)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print("🚀 Reddit collection benchmark against a local fake Pushshift")
+    print(f"Sources: {len(subreddits) * 2}, "
+          f"latency per request: {LATENCY * 1000:.0f} ms")
+
+    results = {}
+    for max_workers in (1, 2, 4, 8):
+        elapsed, count, _ = run_collection(make_collector(base_url, max_workers))
+        results[max_workers] = elapsed
+        print(f"  max_workers={max_workers}: {count} items in {elapsed:.2f}s")
+
+    print(f"\nSpeedup with 8 concurrent sources: {results[1] / results[8]:.2f}x")
+
+    print("\n📈 Incremental refresh with watermarks")
+    collector = make_collector(base_url)
+    for label in ("Full window", "No new activity", "50 new items per source"):
+        if label.startswith("50"):
+            post_new_activity(50)
+        elapsed, count, requests = run_collection(collector)
+        print(f"  {label:<24} {count:>5} items, {requests:>3} requests, {elapsed:.2f}s")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'reddit-stock-tracker-backend'))
+
+# Reproducible, offline runs: validate against the bundled universe instead
+# of Finnhub, and keep the app from collecting or scheduling on import
+os.environ["FINNHUB_API_KEY"] = "demo"
+os.environ.setdefault("STARTUP_COLLECTION", "0")
+os.environ.setdefault("INGEST_INTERVAL", "0")
+os.environ.setdefault("MOCK_SEED", "42")
+
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import create_mention_store
+from app.services.reddit_item import RedditItem
+from app.services.ticker_extractor import TickerExtractor
+from benchmark_ticker_extraction import build_corpus
+
+START_UTC = 1700000000
+SEED = 42
+
+FULL = {
+    "text_lengths": [20, 100, 500],
+    "corpus_items": 2000,
+    "ingest_sizes": [10000, 100000, 1000000],
+    "universe_sizes": [100, 1000, 5000],
+    "day_sizes": [30, 90, 365],
+    "stores": ["dict", "columnar", "sqlite"],
+    "api_requests": 2000,
+    "api_concurrency": [1, 16, 64],
+}
+
+QUICK = {
+    "text_lengths": [20, 100],
+    "corpus_items": 500,
+    "ingest_sizes": [10000, 100000],
+    "universe_sizes": [100, 1000],
+    "day_sizes": [30, 90],
+    "stores": ["dict", "columnar"],
+    "api_requests": 500,
+    "api_concurrency": [1, 16],
+}
+
+
+def timed(run: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Best and median wall time in seconds over repeat calls"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "repeat": repeat,
+    }
+
+
+def bench_extraction(config: dict) -> List[dict]:
+    """extract_tickers and validate_ticker over the seeded corpus"""
+    results = []
+    extractors = {
+        "regex": TickerExtractor(engine="regex"),
+        "automaton": TickerExtractor(engine="automaton"),
+    }
+    for words in config["text_lengths"]:
+        corpus = build_corpus(config["corpus_items"], words, SEED)
+
+        for engine, extractor in extractors.items():
+            extract = extractor.extract_candidates
+            timing = timed(lambda: [extract(text) for text in corpus], 5)
+            timing["items_per_s"] = len(corpus) / timing["min_s"]
+            results.append(_result(
+                "extract_tickers",
+                {"engine": engine, "items": len(corpus), "words_per_item": words},
+                timing,
+            ))
+
+        extractor = extractors["regex"]
+        candidates = sorted(set().union(*map(extractor.extract_tickers, corpus)))
+        timing = timed(lambda: [extractor.validate_ticker(t) for t in candidates], 5)
+        timing["tickers_per_s"] = len(candidates) / timing["min_s"]
+        results.append(_result(
+            "validate_ticker",
+            {"tickers": len(candidates), "words_per_item": words},
+            timing,
+        ))
+    return results
+
+
+def iter_items(count: int, texts: List[str]) -> Iterator[RedditItem]:
+    """count distinct items over 30 days, cycling through a pool of texts"""
+    step = max(1, 30 * 24 * 3600 // count)
+    for i in range(count):
+        yield RedditItem(
+            format(i, "x"),
+            "wallstreetbets",
+            START_UTC + i * step,
+            body=texts[i % len(texts)],
+        )
+
+
+def bench_ingest(config: dict) -> List[dict]:
+    """process_reddit_data end to end at each item count"""
+    results = []
+    texts = build_corpus(5000, 40, SEED)
+    extractor = TickerExtractor()
+    for count in config["ingest_sizes"]:
+        processor = DataProcessor(create_mention_store("dict"))
+        start = time.perf_counter()
+        processor.process_reddit_data(iter_items(count, texts), extractor)
+        elapsed = time.perf_counter() - start
+        mentions = sum(processor.store.ticker_totals().values())
+        processor.close()
+        results.append(_result(
+            "process_reddit_data",
+            {"items": count, "store": "dict", "engine": extractor.engine},
+            {"seconds": elapsed, "items_per_s": count / elapsed, "mentions": mentions},
+        ))
+    return results
+
+
+def bench_queries(config: dict, scratch: str) -> List[dict]:
+    """Trending and history reads at growing universe x day sizes"""
+    results = []
+    for store_kind in config["stores"]:
+        for tickers in config["universe_sizes"]:
+            for days in config["day_sizes"]:
+                db_path = os.path.join(scratch, f"bench-{tickers}x{days}.db")
+                if os.path.exists(db_path):
+                    os.remove(db_path)
+                processor = DataProcessor(create_mention_store(store_kind, db_path))
+                start = time.perf_counter()
+                processor.seed_mock_data(ticker_count=tickers, days=days, seed=SEED)
+                seed_seconds = time.perf_counter() - start
+
+                top = [t["ticker"] for t in processor.get_trending_tickers(10)]
+                params = {"store": store_kind, "tickers": tickers, "days": days}
+                results.append(_result(
+                    "seed_mock_data", params, {"seconds": seed_seconds}
+                ))
+                results.append(_result(
+                    "get_trending_tickers",
+                    params,
+                    timed(lambda: processor.get_trending_tickers(10), 50),
+                ))
+                results.append(_result(
+                    "get_ticker_history",
+                    params,
+                    timed(lambda: processor.get_ticker_history(top[0]), 50),
+                ))
+                results.append(_result(
+                    "get_ticker_histories",
+                    {**params, "batch": len(top)},
+                    timed(lambda: processor.get_ticker_histories(top), 50),
+                ))
+                processor.close()
+                if os.path.exists(db_path):
+                    os.remove(db_path)
+    return results
+
+
+async def _drive(app, requests: List[tuple], concurrency: int) -> List[float]:
+    import httpx
+
+    latencies = []
+    queue = iter(requests)
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+    async with client:
+        async def worker():
+            for method, url, body in queue:
+                start = time.perf_counter()
+                response = await client.request(method, url, json=body)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def _api_requests(pool: List[str], count: int) -> Dict[str, List[tuple]]:
+    """count requests per endpoint, with parameters varying across pool"""
+    rng = random.Random(SEED)
+    return {
+        "GET /api/trending": [
+            ("GET", f"/api/trending?limit={1 + i % 50}", None) for i in range(count)
+        ],
+        "GET /api/ticker/{ticker}/history": [
+            ("GET", f"/api/ticker/{rng.choice(pool)}/history", None)
+            for _ in range(count)
+        ],
+        "POST /api/tickers/history": [
+            ("POST", "/api/tickers/history", {"tickers": rng.sample(pool, 5)})
+            for _ in range(count)
+        ],
+    }
+
+
+def bench_api(config: dict) -> List[dict]:
+    """In-process request throughput through the ASGI app.
+
+    Requests vary their parameters over the top tickers, and every run is
+    repeated with the response cache disabled, labelled cache=off, so the
+    cached numbers can be told apart from the cost of building responses.
+    """
+    import app.main
+    from app.services.response_cache import ResponseCache
+
+    # Seed mock data outside the timed runs
+    trending = app.main.get_data_processor().get_trending_tickers(200)
+    pool = [entry["ticker"] for entry in trending]
+    endpoints = _api_requests(pool, config["api_requests"])
+    caches = {
+        "on": lambda: app.main.response_cache,
+        "off": lambda: ResponseCache(0),
+    }
+
+    results = []
+    cached = app.main.response_cache
+    try:
+        for name, requests in endpoints.items():
+            for cache, make_cache in caches.items():
+                for concurrency in config["api_concurrency"]:
+                    app.main.response_cache = make_cache()
+                    hits_before = app.main.response_cache.stats()["hits"]
+                    start = time.perf_counter()
+                    latencies = asyncio.run(
+                        _drive(app.main.app, requests, concurrency)
+                    )
+                    elapsed = time.perf_counter() - start
+                    hits = app.main.response_cache.stats()["hits"] - hits_before
+                    latencies.sort()
+                    results.append(_result(
+                        "api",
+                        {"endpoint": name, "cache": cache,
+                         "concurrency": concurrency, "requests": len(requests)},
+                        {
+                            "requests_per_s": len(requests) / elapsed,
+                            "p50_ms": latencies[len(latencies) // 2] * 1000,
+                            "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+                            "max_ms": latencies[-1] * 1000,
+                            "cache_hit_rate": hits / len(requests),
+                        },
+                    ))
+    finally:
+        app.main.response_cache = cached
+    return results
+
+
+def _result(benchmark: str, params: dict, metrics: dict) -> dict:
+    line = ", ".join(f"{key}={value}" for key, value in params.items())
+    headline = next(iter(metrics.items()))
+    print(f"  {benchmark:<22} {line:<58} {headline[0]}={headline[1]:.6g}")
+    return {"benchmark": benchmark, "params": params, "metrics": metrics}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Reproducible extraction, ingest, query and API benchmarks"
+    )
+    parser.add_argument("--quick", action="store_true",
+                        help="smaller sizes for a fast smoke run")
+    parser.add_argument("--only", nargs="+",
+                        choices=["extraction", "ingest", "queries", "api"],
+                        help="run only these sections")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="where to write the JSON results")
+    parser.add_argument("--scratch", default=".",
+                        help="directory for temporary SQLite files")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    config = QUICK if args.quick else FULL
+    sections = {
+        "extraction": lambda: bench_extraction(config),
+        "ingest": lambda: bench_ingest(config),
+        "queries": lambda: bench_queries(config, args.scratch),
+        "api": lambda: bench_api(config),
+    }
+
+    print(f"📊 Benchmark suite ({'quick' if args.quick else 'full'}), seed {SEED}")
+    results = []
+    for name, run in sections.items():
+        if args.only and name not in args.only:
+            continue
+        print(f"\n▶️  {name}")
+        start = time.perf_counter()
+        results.extend(run())
+        print(f"  ({time.perf_counter() - start:.1f}s)")
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": SEED,
+            "quick": args.quick,
+            "config": config,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import random
+import time
+from typing import Callable, List, Set
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'reddit-stock-tracker-backend'))
+
+from app.services.ticker_extractor import TickerExtractor
+from app.services.ticker_universe import get_ticker_universe
+
+NOISE_WORDS = [
+    "the", "market", "is", "going", "to", "moon", "YOLO", "DD", "IMO", "CEO",
+    "EPS", "calls", "puts", "HODL", "FOMO", "ATH", "buy", "sell", "LOL", "WSB",
+    "earnings", "USA", "FED", "CPI", "GDP", "bagholder", "tendies", "I", "am",
+    "NOT", "a", "financial", "advisor", "THIS", "IS", "THE", "WAY", "EOD", "OTM",
+]
+
+
+def build_corpus(items: int, words_per_item: int, seed: int = 42) -> List[str]:
+    """Build a seeded synthetic Reddit corpus with a sprinkle of real tickers"""
+    rng = random.Random(seed)
+    tickers = sorted(get_ticker_universe().symbols)
+    corpus = []
+    for _ in range(items):
+        words = []
+        for _ in range(words_per_item):
+            roll = rng.random()
+            if roll < 0.03:
+                words.append("$" + rng.choice(tickers))
+            elif roll < 0.06:
+                words.append(rng.choice(tickers))
+            else:
+                words.append(rng.choice(NOISE_WORDS))
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def time_engine(
+    extract: Callable[[str], Set[str]], corpus: List[str], rounds: int = 5
+) -> float:
+    """Best-of-N wall time in seconds for one pass over the corpus"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in corpus:
+            extract(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print("=" * 60)
+    print("TICKER EXTRACTION BENCHMARK: regex vs automaton")
+    print("=" * 60)
+
+    regex = TickerExtractor(engine="regex")
+    automaton = TickerExtractor(engine="automaton")
+
+    for words_per_item in (20, 100, 500):
+        corpus = build_corpus(2000, words_per_item)
+
+        # The automaton also understands single-letter cashtags and dotted
+        # share classes, which the regex path never emits.
+        mismatches = 0
+        for text in corpus:
+            expected = regex.extract_valid_tickers(text)
+            actual = {
+                t for t in automaton.extract_valid_tickers(text)
+                if len(t) >= 2 and "." not in t
+            }
+            if expected != actual:
+                mismatches += 1
+
+        regex_time = time_engine(regex.extract_valid_tickers, corpus)
+        automaton_time = time_engine(automaton.extract_valid_tickers, corpus)
+
+        print(f"\n{len(corpus)} items x {words_per_item} words")
+        print(f"  regex + validate : {regex_time * 1000:8.1f} ms")
+        print(f"  automaton        : {automaton_time * 1000:8.1f} ms")
+        print(f"  speedup          : {regex_time / automaton_time:8.2f}x")
+        print(f"  mismatched items : {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,40 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-from .services.reddit_collector import RedditCollector
 from .services.ticker_extractor import TickerExtractor
-from .services.data_processor import DataProcessor
+from .services.data_processor import DataProcessor, HISTORY_GRANULARITIES
+from .services import metrics
+from .services.ingest_election import IngestLease
+from .services.ingest_scheduler import IngestScheduler
+from .services.refresh_jobs import RefreshJob, RefreshJobManager
+from .services.response_cache import ResponseCache
+from .services.ticker_universe import reload_ticker_universe
+from .services.trending_broadcaster import TrendingBroadcaster
+from .services.trending_index import TRENDING_WINDOWS
 
 load_dotenv()
 
-app = FastAPI(title="Reddit Stock Trend Tracker")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_event()
+    yield
+    shutdown_event()
+
+
+app = FastAPI(title="Reddit Stock Trend Tracker", lifespan=lifespan)
 
 # Disable CORS. Do not remove this for full-stack development.
 app.add_middleware(
@@ -20,66 +45,564 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+app.add_middleware(metrics.RequestMetricsMiddleware)
+
+_services: Dict[str, object] = {}
+_services_lock = threading.RLock()  # factories may fetch other services
+
+initial_job_id: Optional[str] = None  # refresh job started at startup
+ingest_scheduler: Optional[IngestScheduler] = None
+ingest_lease: Optional[IngestLease] = None  # set when workers share one store
+response_cache = ResponseCache(int(os.getenv("RESPONSE_CACHE_SIZE", "256")))
+max_batch_tickers = int(os.getenv("MAX_BATCH_TICKERS", "250"))
+
+STORE_DATES = metrics.gauge("mention_store_dates", "Dates held in the mention store")
+STORE_TICKERS = metrics.gauge(
+    "mention_store_tickers", "Distinct tickers with stored mentions"
+)
+DATA_VERSION = metrics.gauge("data_version", "Writes applied since startup")
+LAST_INGEST = metrics.gauge(
+    "last_ingest_timestamp_seconds", "When the last ingest finished"
+)
+VALIDATION_CACHE = metrics.gauge(
+    "ticker_validation_cache", "Ticker validation cache statistics", ("stat",)
+)
+RESPONSE_CACHE = metrics.gauge(
+    "response_cache", "Read response cache statistics", ("stat",)
+)
+STREAM = metrics.gauge("trending_stream", "Trending stream statistics", ("stat",))
+DEDUP = metrics.gauge("item_dedup", "Ingest item deduplicator statistics", ("stat",))
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _get_service(name: str, factory: Callable[[], object]):
+    """Build a service on first use and reuse it afterwards"""
+    service = _services.get(name)
+    if service is None:
+        with _services_lock:
+            service = _services.get(name)
+            if service is None:
+                service = factory()
+                _services[name] = service
+    return service
+
+
+def _build_reddit_collector():
+    dump_paths = os.getenv("REDDIT_DUMP_PATHS")
+    if dump_paths:
+        from .services.dump_collector import DumpCollector
+
+        dump_end = os.getenv("REDDIT_DUMP_END")
+        return DumpCollector(
+            dump_paths.split(os.pathsep),
+            end_time=datetime.fromisoformat(dump_end) if dump_end else None,
+        )
+
+    # pmaw is slow to import and spins up a worker pool, so defer both
+    from .services.reddit_collector import RedditCollector
+
+    return RedditCollector()
+
+
+def _is_ingest_worker() -> bool:
+    """Whether this process may write: always, unless it lost the election"""
+    return ingest_lease is None or ingest_lease.leader
+
+
+def _build_data_processor() -> DataProcessor:
+    processor = DataProcessor()
+    # Mock data is never written to a durable store unless asked for explicitly
+    if (
+        _env_flag("MOCK_DATA", not processor.store.persistent)
+        and _is_ingest_worker()
+        and not processor.get_all_dates()
+    ):
+        mock_tickers = os.getenv("MOCK_TICKERS")
+        processor.seed_mock_data(
+            ticker_count=int(mock_tickers) if mock_tickers else None,
+            days=int(os.getenv("MOCK_DAYS", "30")),
+            seed=int(os.getenv("MOCK_SEED", "42")),
+            hourly=_env_flag("MOCK_HOURLY", False),
+        )
+    return processor
+
+
+def _build_trending_broadcaster() -> TrendingBroadcaster:
+    data_processor = get_data_processor()
+    broadcaster = TrendingBroadcaster(
+        data_processor.get_trending_tickers,
+        limit=int(os.getenv("TRENDING_STREAM_LIMIT", "10")),
+        max_queue=int(os.getenv("TRENDING_STREAM_QUEUE", "16")),
+    )
+    data_processor.listeners.append(broadcaster.publish)
+    return broadcaster
+
+
+def get_reddit_collector():
+    return _get_service("reddit_collector", _build_reddit_collector)
+
 
-reddit_collector = RedditCollector()
-ticker_extractor = TickerExtractor()
-data_processor = DataProcessor()
+def get_ticker_extractor() -> TickerExtractor:
+    return _get_service("ticker_extractor", TickerExtractor)
+
+
+def get_data_processor() -> DataProcessor:
+    return _get_service("data_processor", _build_data_processor)
+
+
+def get_refresh_jobs() -> RefreshJobManager:
+    return _get_service("refresh_jobs", RefreshJobManager)
+
+
+def get_trending_broadcaster() -> TrendingBroadcaster:
+    return _get_service("trending_broadcaster", _build_trending_broadcaster)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of etag against an If-None-Match header's list"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in {
+        tag.removeprefix("W/") for tag in tags
+    }
+
+
+def _cached_json(
+    request: Request, endpoint: str, params: Tuple, build: Callable[[], Dict]
+) -> Response:
+    """Serve build() as JSON, memoized and ETagged per data version.
+
+    Clients that send back the current ETag in If-None-Match get a 304
+    without the body being rebuilt or re-sent. With a durable store the
+    version comes from the store, so workers sharing it agree on ETags.
+    """
+    version = get_data_processor().version
+    key = (endpoint, params)
+
+    entry = response_cache.get(version, key)
+    if entry is None:
+        body = JSONResponse(build()).body
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        etag = f'W/"{version[0]}.{version[1]}.{digest}"'
+        response_cache.set(version, key, etag, body)
+    else:
+        etag, body = entry
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 class TickerRequest(BaseModel):
     ticker: str
 
 
+class TickersRequest(BaseModel):
+    tickers: List[str]
+    start: Optional[date] = None
+    end: Optional[date] = None
+
+
+class TickersHistoryRequest(TickersRequest):
+    granularity: str = "day"
+
+
+def _batch_params(request: TickersRequest) -> Tuple:
+    """Deduplicated uppercase tickers and ISO date bounds of a batch request"""
+    tickers = tuple(dict.fromkeys(ticker.upper() for ticker in request.tickers))
+    if not tickers or len(tickers) > max_batch_tickers:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Expected between 1 and {max_batch_tickers} tickers, "
+            f"got {len(tickers)}",
+        )
+    return (
+        tickers,
+        request.start.isoformat() if request.start else None,
+        request.end.isoformat() if request.end else None,
+    )
+
+
 @app.get("/healthz")
 async def healthz():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Metrics in the Prometheus text exposition format"""
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+def _collect_service_metrics():
+    """Read gauges from services that exist; a scrape never builds one"""
+    data_processor = _services.get("data_processor")
+    if data_processor is not None:
+        STORE_DATES.set(len(data_processor.get_all_dates()))
+        STORE_TICKERS.set(len(data_processor.trending.totals))
+        DATA_VERSION.set(data_processor.data_version)
+        if data_processor.last_ingest_at:
+            LAST_INGEST.set(data_processor.last_ingest_at)
+        for name, value in data_processor.deduplicator.stats().items():
+            DEDUP.labels(name).set(value)
+
+    ticker_extractor = _services.get("ticker_extractor")
+    if ticker_extractor is not None:
+        for name, value in ticker_extractor.validation_cache.stats().items():
+            VALIDATION_CACHE.labels(name).set(value)
+
+    for name, value in response_cache.stats().items():
+        RESPONSE_CACHE.labels(name).set(value)
+
+    broadcaster = _services.get("trending_broadcaster")
+    if broadcaster is not None:
+        for name, value in broadcaster.stats().items():
+            STREAM.labels(name).set(value)
+
+
+metrics.REGISTRY.on_collect(_collect_service_metrics)
+
+
+@app.get("/readyz")
+async def readyz(response: Response):
+    """Report whether mention data is loaded and how fresh it is"""
+    data_processor = get_data_processor()
+    dates = data_processor.get_all_dates()
+    last_ingest_at = data_processor.last_ingest_at
+    if not dates:
+        response.status_code = 503
+
+    return {
+        "status": "ready" if dates else "warming",
+        "latest_date": dates[-1] if dates else None,
+        "last_ingest_at": last_ingest_at,
+        "data_age_seconds": (
+            round(time.time() - last_ingest_at, 3) if last_ingest_at else None
+        ),
+        "initial_collection": _initial_collection_status(),
+        "role": (
+            "standalone"
+            if ingest_lease is None
+            else "ingest" if ingest_lease.leader else "reader"
+        ),
+    }
+
+
+def _initial_collection_status() -> Dict:
+    if initial_job_id is None:
+        return {"status": "disabled"}
+    job = get_refresh_jobs().get(initial_job_id)
+    return job.to_dict() if job else {"status": "expired", "job_id": initial_job_id}
+
+
 @app.get("/api/trending")
-async def get_trending_tickers(limit: int = 10):
-    """Get top trending stock tickers"""
-    trending = data_processor.get_trending_tickers(limit)
-    return {"trending_tickers": trending}
+async def get_trending_tickers(
+    request: Request, limit: int = 10, window: Optional[str] = None
+):
+    """Get top trending stock tickers, optionally within a 24h/7d/30d window"""
+    if window is not None and window not in TRENDING_WINDOWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown window {window!r}, expected one of "
+            f"{', '.join(TRENDING_WINDOWS)}",
+        )
+    params = (limit, window, date.today().isoformat() if window else None)
+
+    def build():
+        trending = get_data_processor().get_trending_tickers(limit, window)
+        return {"trending_tickers": trending}
+
+    return _cached_json(request, "trending", params, build)
+
+
+@app.get("/api/trending/stream")
+async def stream_trending(request: Request):
+    """Stream trending ranking changes as Server-Sent Events.
+
+    The first event is a ``snapshot`` of the ranking; each ``delta`` after
+    it lists the tickers whose rank or total changed and those that left.
+    """
+    broadcaster = get_trending_broadcaster()
+    subscriber = broadcaster.subscribe(asyncio.get_running_loop())
+    heartbeat = float(os.getenv("TRENDING_STREAM_HEARTBEAT", "15"))
+
+    async def events():
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    return
+                yield event
+        finally:
+            broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/api/ticker/{ticker}/history")
-async def get_ticker_history(ticker: str):
+async def get_ticker_history(
+    request: Request,
+    ticker: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    granularity: str = "day",
+):
     """Get mention history for a specific ticker"""
-    history = data_processor.get_ticker_history(ticker)
-    return {"ticker": ticker.upper(), "history": history}
+    if granularity not in HISTORY_GRANULARITIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown granularity {granularity!r}, expected one of "
+            f"{', '.join(HISTORY_GRANULARITIES)}",
+        )
+    params = (
+        ticker.upper(),
+        start.isoformat() if start else None,
+        end.isoformat() if end else None,
+        granularity,
+    )
+
+    def build():
+        history = get_data_processor().get_ticker_history(*params)
+        return {"ticker": ticker.upper(), "history": history}
+
+    return _cached_json(request, "history", params, build)
 
 
 @app.post("/api/ticker/validate")
-async def validate_ticker(request: TickerRequest):
-    """Validate a custom ticker"""
-    is_valid = ticker_extractor.validate_ticker(request.ticker.upper())
+def validate_ticker(request: TickerRequest):
+    """Validate a custom ticker; sync, so the Finnhub call runs off the loop"""
+    is_valid = get_ticker_extractor().validate_ticker(request.ticker.upper())
     return {"ticker": request.ticker.upper(), "valid": is_valid}
 
 
-@app.get("/api/data/refresh")
-async def refresh_data():
-    """Manually refresh Reddit data"""
+@app.post("/api/tickers/history")
+async def get_tickers_history(request: Request, body: TickersHistoryRequest):
+    """Get mention history for several tickers on a shared date axis"""
+    if body.granularity not in HISTORY_GRANULARITIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown granularity {body.granularity!r}, expected one of "
+            f"{', '.join(HISTORY_GRANULARITIES)}",
+        )
+    tickers, start, end = _batch_params(body)
+    params = (tickers, start, end, body.granularity)
+
+    def build():
+        return get_data_processor().get_ticker_histories(*params)
+
+    return _cached_json(request, "histories", params, build)
+
+
+@app.post("/api/tickers/validate")
+def validate_tickers(request: TickersRequest):
+    """Validate several tickers and report their mentions in the date range"""
+    tickers, start, end = _batch_params(request)
+    validity = get_ticker_extractor().validate_many(tickers)
+    series = get_data_processor().get_ticker_histories(tickers, start, end)["tickers"]
+    return {
+        "start": start,
+        "end": end,
+        "results": [
+            {
+                "ticker": ticker,
+                "valid": validity.get(ticker, False),
+                "mentions": sum(series[ticker]),
+            }
+            for ticker in tickers
+        ],
+    }
+
+
+@app.post("/api/universe/reload")
+async def reload_universe():
+    """Hot-reload the ticker universe artifact"""
     try:
-        print("Starting data refresh...")
-        reddit_data = reddit_collector.collect_recent_data(30)
-        data_processor.process_reddit_data(reddit_data, ticker_extractor)
-        trending = data_processor.get_trending_tickers(10)
-        return {
-            "status": "success",
-            "items_processed": len(reddit_data),
-            "trending_count": len(trending),
-        }
+        universe = reload_ticker_universe()
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error refreshing data: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Error reloading ticker universe: {str(e)}"
+        )
+    return {"version": universe.version, "ticker_count": len(universe)}
+
+
+def _iter_counted(items, job: RefreshJob):
+    for item in items:
+        job.items_fetched += 1
+        yield item
+
 
+def _run_refresh(job: RefreshJob):
+    """Collect new Reddit items and fold them into the mention data"""
+    print(f"Starting data refresh (job {job.id})...")
+    ticker_extractor = get_ticker_extractor()
+    data_processor = get_data_processor()
+    reddit_collector = get_reddit_collector()
 
-@app.on_event("startup")
-async def startup_event():
-    """Collect initial data on startup"""
+    def report(items_processed: int, mentions_counted: int):
+        job.items_processed = items_processed
+        job.mentions_counted = mentions_counted
+
+    reddit_data = _iter_counted(reddit_collector.iter_recent_data(30), job)
     try:
-        print("Collecting Reddit data on startup...")
-        reddit_data = reddit_collector.collect_recent_data(30)
-        data_processor.process_reddit_data(reddit_data, ticker_extractor)
-        print(f"Processed {len(reddit_data)} Reddit items")
-    except Exception as e:
-        print(f"Error during startup data collection: {e}")
+        data_processor.process_reddit_data(
+            reddit_data, ticker_extractor, progress=report
+        )
+        failed = reddit_collector.failed_sources
+        if failed and len(failed) == reddit_collector.sources_attempted:
+            raise RuntimeError(f"Every source failed: {', '.join(failed)}")
+    except Exception:
+        reddit_collector.watermarks.discard()
+        raise
+    reddit_collector.watermarks.commit()
+    reddit_collector.watermarks.save()
+    ticker_extractor.validation_cache.save()
+
+
+def _run_initial_refresh(job: RefreshJob):
+    """Collect the initial window, or catch up from watermarks"""
+    data_processor = get_data_processor()
+    reddit_collector = get_reddit_collector()
+    if (
+        data_processor.store.persistent
+        and data_processor.get_all_dates()
+        and not len(reddit_collector.watermarks)
+        and data_processor.store.get_meta("mock_data") is None
+    ):
+        # Without watermarks we cannot tell what the stored data covers
+        print("Loaded persisted mention data, skipping startup collection")
+        job.status = "skipped"
+        return
+
+    _run_refresh(job)
+
+
+@app.post("/api/data/refresh", status_code=202)
+async def start_refresh():
+    """Start a background refresh, or join the one already running"""
+    if not _is_ingest_worker():
+        ingest_lease.request_refresh()
+        return {
+            "job_id": None,
+            "status": "forwarded",
+            "ingest_worker_pid": ingest_lease.holder_pid(),
+            "coalesced": False,
+        }
+    job, created = get_refresh_jobs().submit(_run_refresh)
+    return {**job.to_dict(), "coalesced": not created}
+
+
+@app.get("/api/data/refresh")
+async def refresh_data():
+    """Manually refresh Reddit data (kept for older clients; does not block)"""
+    return await start_refresh()
+
+
+@app.get("/api/data/refresh/{job_id}")
+async def refresh_status(job_id: str):
+    """Progress of a refresh job"""
+    job = get_refresh_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown refresh job: {job_id}")
+    return job.to_dict()
+
+
+@app.get("/api/scheduler")
+async def scheduler_status():
+    """Timing and outcome of the periodic ingest scheduler"""
+    if ingest_scheduler is None:
+        return {"running": False}
+    return ingest_scheduler.stats()
+
+
+def startup_event():
+    """Elect the ingest worker when sharing a store, then start ingestion.
+
+    With SHARED_INGEST on, workers started with ``--workers N`` share one
+    SQLite store: the elected worker collects and writes, the others serve
+    reads from the store and take over if the ingest worker exits.
+    """
+    global ingest_lease
+    if _env_flag("SHARED_INGEST", False):
+        if os.getenv("MENTION_STORE", "dict") != "sqlite":
+            raise RuntimeError("SHARED_INGEST requires MENTION_STORE=sqlite")
+
+        lock_path = os.getenv("INGEST_LOCK_PATH") or (
+            os.getenv("MENTION_DB_PATH", "mentions.db") + ".ingest.lock"
+        )
+        ingest_lease = IngestLease(
+            lock_path, float(os.getenv("READER_SYNC_INTERVAL", "1"))
+        )
+        if ingest_lease.try_acquire():
+            print(f"Worker {os.getpid()} elected to run ingestion")
+        else:
+            print(
+                f"Worker {os.getpid()} serving reads, ingestion runs in worker "
+                f"{ingest_lease.holder_pid()}"
+            )
+        ingest_lease.start(_start_ingest, _request_refresh, _follow_store)
+        if not ingest_lease.leader:
+            return
+
+    _start_ingest()
+
+
+def _request_refresh():
+    get_refresh_jobs().submit(_run_refresh, kind="requested")
+
+
+def _follow_store():
+    get_data_processor().sync_from_store(0)
+
+
+def _start_ingest():
+    """Queue the initial collection and start periodic ingestion"""
+    global initial_job_id, ingest_scheduler
+    if _env_flag("STARTUP_COLLECTION", True):
+        job, _ = get_refresh_jobs().submit(_run_initial_refresh, kind="startup")
+        initial_job_id = job.id
+
+    interval = float(os.getenv("INGEST_INTERVAL", "900"))
+    if interval > 0:
+        ingest_scheduler = IngestScheduler(
+            lambda: get_refresh_jobs().submit(_run_refresh, kind="scheduled"),
+            interval=interval,
+            jitter=float(os.getenv("INGEST_JITTER", "0.1")),
+            max_backoff=float(os.getenv("INGEST_MAX_BACKOFF", "3600")),
+        )
+        ingest_scheduler.start()
+
+
+def shutdown_event():
+    """Stop background work, persist the validation cache, close the processor"""
+    writer = _is_ingest_worker()
+    if ingest_scheduler is not None:
+        ingest_scheduler.stop()
+    if ingest_lease is not None:
+        ingest_lease.stop()
+    if writer and "ticker_extractor" in _services:
+        try:
+            get_ticker_extractor().validation_cache.save()
+        except Exception as e:
+            print(f"Error saving validation cache: {e}")
+    if "refresh_jobs" in _services:
+        get_refresh_jobs().shutdown()
+    if "trending_broadcaster" in _services:
+        get_trending_broadcaster().close()
+    if "data_processor" in _services:
+        get_data_processor().close()
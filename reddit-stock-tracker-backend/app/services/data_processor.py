@@ -1,138 +1,353 @@
+import os
+import time
+import uuid
 from collections import defaultdict
-from datetime import datetime
-from typing import Dict, List
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import metrics
+from .item_dedup import ItemDeduplicator
+from .mention_store import MentionStore, create_mention_store
+from .mock_data import MockDataGenerator
+from .parallel_extraction import ExtractionPool, count_candidates
+from .reddit_item import RedditItem
+from .trending_index import TrendingIndex
+
+HISTORY_GRANULARITIES = ("day", "week", "month")
+
+# Items read from the source per extract/validate/store round trip
+DEFAULT_BATCH_SIZE = 5000
+
+INGEST_ITEMS = metrics.counter("ingest_items_total", "Items read by the processor")
+INGEST_DUPLICATES = metrics.counter(
+    "ingest_duplicate_items_total", "Items skipped as already counted"
+)
+INGEST_MENTIONS = metrics.counter(
+    "ingest_mentions_total", "Validated ticker mentions stored"
+)
+INGEST_STAGE_SECONDS = metrics.histogram(
+    "ingest_stage_seconds", "Time per ingest batch spent in each stage", ("stage",)
+)
+STAGE_SECONDS = {
+    stage: INGEST_STAGE_SECONDS.labels(stage)
+    for stage in ("prepare", "extract", "validate", "store")
+}
 
 
 class DataProcessor:
-    def __init__(self):
-        self.mention_data = defaultdict(
-            lambda: defaultdict(int)
-        )  # {date: {ticker: count}}
+    def __init__(
+        self,
+        store: Optional[MentionStore] = None,
+        deduplicator: Optional[ItemDeduplicator] = None,
+    ):
+        self.store = store or create_mention_store(
+            os.getenv("MENTION_STORE", "dict"), os.getenv("MENTION_DB_PATH")
+        )
+        self.deduplicator = deduplicator or ItemDeduplicator(
+            recent_seconds=int(float(os.getenv("DEDUP_RECENT_HOURS", "48")) * 3600),
+            capacity=int(os.getenv("DEDUP_CAPACITY", "1000000")),
+            error_rate=float(os.getenv("DEDUP_ERROR_RATE", "0.001")),
+            max_bytes=int(os.getenv("DEDUP_MAX_BYTES", str(16 * 1024 * 1024))),
+        )
+        self.trending = TrendingIndex()
+        extraction_workers = int(os.getenv("EXTRACTION_WORKERS", "1"))
+        self.extraction_pool = (
+            ExtractionPool(extraction_workers) if extraction_workers > 1 else None
+        )
         self.ticker_metadata = {}  # {ticker: {name, last_price, etc}}
-        self._initialize_mock_data()
+        self.last_ingest_at: Optional[float] = None  # epoch seconds
+        # Bumped on every write; with the instance id it identifies a data
+        # snapshot, so cached responses can be keyed and validated on it
+        self.data_version = 0
+        self.instance_id = uuid.uuid4().hex[:8]
+        # A durable store names its own snapshots, the same in every worker
+        self.store_snapshot = self.store.snapshot_id()
+        # Called with no arguments after every write, on the writing thread
+        self.listeners: List[Callable[[], None]] = []
+        self._store_token = self.store.change_token()
+        self._synced_at = 0.0
+
+        if self.store.dates():
+            self._load_trending_from_store()
+
+    def process_reddit_data(
+        self,
+        reddit_data: Iterable[Union[RedditItem, Dict]],
+        ticker_extractor,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Process Reddit data and extract ticker mentions by date
+
+        Items are RedditItem records or raw Reddit dicts, consumed in bounded
+        batches, so reddit_data can be a generator and peak memory stays
+        independent of the window size.
+        Items whose id was already counted are skipped before any text is
+        assembled. Within a batch, candidates are counted per date first
+        (across EXTRACTION_WORKERS processes when that is above 1) so each
+        distinct ticker is validated once, in a single bulk call. progress,
+        if given, is called after each batch with the running item and
+        mention counts. Returns the number of items consumed.
+        """
+        batch_size = batch_size or int(
+            os.getenv("PROCESS_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        )
+        items = iter(reddit_data)
+        item_count = 0
+        processed_count = 0
+        duplicates_before = self.deduplicator.duplicates
+
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                break
+            item_count += len(batch)
+            processed_count += self._process_batch(batch, ticker_extractor)
+            if progress is not None:
+                progress(item_count, processed_count)
 
-    def process_reddit_data(self, reddit_data: List[Dict], ticker_extractor):
-        """Process Reddit data and extract ticker mentions by date"""
+        self.last_ingest_at = time.time()
+        duplicates = self.deduplicator.duplicates - duplicates_before
+        print(
+            f"Processed {processed_count} ticker mentions from {item_count} items "
+            f"({duplicates} duplicates skipped)"
+        )
+        return item_count
+
+    def _process_batch(
+        self, batch: List[Union[RedditItem, Dict]], ticker_extractor
+    ) -> int:
+        """Extract, validate and store one batch; returns the mention count"""
+        started = time.perf_counter()
         processed_count = 0
+        duplicates = 0
+        keys = {}  # {key: created_utc}, recorded once the batch is stored
+        pairs = []  # [(date, text)]
 
-        for item in reddit_data:
+        for item in batch:
             try:
-                created_utc = item.get("created_utc", 0)
+                if not isinstance(item, RedditItem):
+                    item = RedditItem.from_dict(item)
+
+                created_utc = item.created_utc
                 if created_utc:
                     item_date = datetime.fromtimestamp(created_utc).date()
                 else:
                     continue
 
-                text = ""
-                if "title" in item:
-                    text += item["title"] + " "
-                if "selftext" in item:
-                    text += item["selftext"] + " "
-                if "body" in item:
-                    text += item["body"] + " "
+                key = item.key
+                if key is not None:
+                    if key in keys or self.deduplicator.contains(key, created_utc):
+                        duplicates += 1
+                        continue
+                    keys[key] = created_utc
 
+                text = item.text()
                 if not text.strip():
                     continue
 
-                tickers = ticker_extractor.extract_tickers(text)
-                for ticker in tickers:
-                    if ticker_extractor.validate_ticker(ticker):
-                        self.mention_data[item_date.isoformat()][ticker] += 1
-                        processed_count += 1
+                pairs.append((item_date.isoformat(), text))
 
             except Exception as e:
                 print(f"Error processing item: {e}")
                 continue
 
-        print(f"Processed {processed_count} ticker mentions")
+        prepared = time.perf_counter()
+        STAGE_SECONDS["prepare"].observe(prepared - started)
+
+        if self.extraction_pool is not None:
+            candidate_counts = self.extraction_pool.count(pairs, ticker_extractor)
+        else:
+            candidate_counts = count_candidates(pairs, ticker_extractor)
+
+        candidates = set()
+        for counter in candidate_counts.values():
+            candidates.update(counter)
+        extracted = time.perf_counter()
+        STAGE_SECONDS["extract"].observe(extracted - prepared)
+
+        validity = ticker_extractor.validate_many(candidates)
+        batch_counts = defaultdict(lambda: defaultdict(int))
+        for date_str, counter in candidate_counts.items():
+            for ticker, count in counter.items():
+                if validity[ticker]:
+                    batch_counts[date_str][ticker] += count
+                    processed_count += count
+        validated = time.perf_counter()
+        STAGE_SECONDS["validate"].observe(validated - extracted)
 
-    def get_trending_tickers(self, limit: int = 10) -> List[Dict]:
-        """Get top trending tickers by total mentions"""
-        ticker_totals = defaultdict(int)
-        for date_data in self.mention_data.values():
-            for ticker, count in date_data.items():
-                ticker_totals[ticker] += count
+        self._add_counts(batch_counts)
+        self.deduplicator.record(keys, duplicates)
+        self.deduplicator.prune()
+        STAGE_SECONDS["store"].observe(time.perf_counter() - validated)
 
-        sorted_tickers = sorted(ticker_totals.items(), key=lambda x: x[1], reverse=True)
+        INGEST_ITEMS.inc(len(batch))
+        INGEST_DUPLICATES.inc(duplicates)
+        INGEST_MENTIONS.inc(processed_count)
+        return processed_count
+
+    def get_trending_tickers(
+        self, limit: int = 10, window: Optional[str] = None
+    ) -> List[Dict]:
+        """Get top trending tickers by total mentions, optionally windowed"""
         return [
             {"ticker": ticker, "total_mentions": count}
-            for ticker, count in sorted_tickers[:limit]
+            for ticker, count in self.trending.top(limit, window)
         ]
 
-    def get_ticker_history(self, ticker: str) -> List[Dict]:
-        """Get mention history for a specific ticker"""
-        history = []
-        for date_str, tickers in self.mention_data.items():
-            count = tickers.get(ticker.upper(), 0)
-            history.append({"date": date_str, "mentions": count})
+    def get_ticker_history(
+        self,
+        ticker: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        granularity: str = "day",
+    ) -> List[Dict]:
+        """Get mention history for a specific ticker, optionally in a date range
+
+        Daily points are rolled up into ISO weeks (keyed by their Monday) or
+        calendar months (keyed by their first day) when requested.
+        """
+        if granularity not in HISTORY_GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}")
+
+        history = self.store.ticker_history(ticker.upper(), start, end)
+        if granularity != "day":
+            history = self._roll_up(history, granularity)
+
+        return [{"date": date_str, "mentions": count} for date_str, count in history]
 
-        return sorted(history, key=lambda x: x["date"])
+    def get_ticker_histories(
+        self,
+        tickers: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        granularity: str = "day",
+    ) -> Dict:
+        """Mention history for several tickers as one columnar table.
+
+        All series share a single date axis, read from the store in one
+        lookup; ``tickers`` maps each symbol to its counts on that axis.
+        """
+        if granularity not in HISTORY_GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}")
+
+        symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        dates, series = self.store.history_matrix(symbols, start, end)
+        if granularity != "day":
+            periods = [self._period(date_str, granularity) for date_str in dates]
+            dates = list(dict.fromkeys(periods))
+            slot = {period: i for i, period in enumerate(dates)}
+            positions = [slot[period] for period in periods]
+            rolled = {}
+            for ticker, counts in series.items():
+                row = [0] * len(dates)
+                for position, count in zip(positions, counts):
+                    row[position] += count
+                rolled[ticker] = row
+            series = rolled
+
+        return {"dates": dates, "tickers": series}
+
+    def sync_from_store(self, min_interval: float = 1.0) -> bool:
+        """Pick up writes another process made to a shared store.
+
+        For read-only workers: when the store reports a change, the
+        trending index is rebuilt and data_version bumped so cached
+        responses are invalidated. The store is checked at most once per
+        min_interval seconds. Returns whether anything was reloaded.
+        """
+        now = time.monotonic()
+        if now - self._synced_at < min_interval:
+            return False
+        self._synced_at = now
+
+        token = self.store.change_token()
+        if token == self._store_token:
+            return False
+        self._store_token = token
+        self._load_trending_from_store()
+        self.last_ingest_at = time.time()
+        return True
+
+    @property
+    def version(self) -> Tuple[str, int]:
+        """Identifies the data being served, for keying cached responses"""
+        if self.store_snapshot is not None:
+            return self.store_snapshot
+        return self.instance_id, self.data_version
 
     def get_all_dates(self) -> List[str]:
         """Get all dates with data"""
-        return sorted(list(self.mention_data.keys()))
-
-    def _initialize_mock_data(self):
-        """Initialize mock data for testing purposes"""
-        import random
-        from datetime import datetime, timedelta
-        
-        base_mentions = {
-            'AAPL': 2500, 'MSFT': 2200, 'GOOGL': 2000, 'GOOG': 2000, 'AMZN': 1900,
-            'NVDA': 2800, 'TSLA': 3000, 'META': 1800, 'BRK.B': 1200, 'BRK.A': 800,
-            
-            'V': 1000, 'JPM': 1100, 'JNJ': 900, 'WMT': 800, 'PG': 700,
-            'UNH': 900, 'HD': 800, 'MA': 950, 'BAC': 1200, 'XOM': 1100,
-            
-            'GME': 2500, 'AMC': 2000, 'PLTR': 1500, 'BB': 1200, 'NOK': 1000,
-            'COIN': 1800, 'HOOD': 1400, 'RBLX': 1300, 'SNOW': 1100,
-        }
-        
-        top_200_tickers = [
-            "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "NVDA", "TSLA", "META", "BRK.B", "BRK.A",
-            "V", "JPM", "JNJ", "WMT", "PG", "UNH", "HD", "MA", "BAC", "XOM",
-            "ORCL", "CVX", "LLY", "ABBV", "KO", "AVGO", "PEP", "COST", "TMO", "MRK",
-            "ACN", "CSCO", "ABT", "DHR", "TXN", "VZ", "ADBE", "NKE", "CRM", "WFC",
-            "NFLX", "DIS", "INTC", "AMD", "CMCSA", "PFE", "PM", "RTX", "NEE", "UPS",
-            "T", "LOW", "QCOM", "HON", "UNP", "MS", "CAT", "GS", "IBM", "AMGN",
-            "BLK", "AXP", "DE", "SPGI", "BKNG", "MDT", "ADP", "GILD", "LRCX", "TJX",
-            "VRTX", "SYK", "SCHW", "C", "ZTS", "MMC", "CB", "MO", "USB", "PYPL",
-            "SO", "PNC", "AON", "DUK", "CSX", "TMUS", "FCX", "BMY", "NOW", "AMAT",
-            "SHW", "MU", "ICE", "GE", "CME", "TGT", "REGN", "APD", "EOG", "NSC",
-            "KLAC", "SLB", "MDLZ", "ADI", "ISRG", "CI", "CMG", "FISV", "TFC", "MCD",
-            "CVS", "EMR", "BSX", "ITW", "WM", "GD", "MCO", "FDX", "NOC", "EQIX",
-            "APH", "ECL", "PSA", "CL", "WELL", "PLD", "EL", "MCHP", "HUM", "CTAS",
-            "FAST", "PAYX", "ROST", "ODFL", "VRSK", "EXC", "KMB", "CTSH", "GWW", "IDXX",
-            "YUM", "BIIB", "KHC", "DXCM", "EA", "SBUX", "MNST", "EW", "ILMN", "WBA",
-            "CSGP", "ANSS", "ZBH", "CPRT", "MKTX", "WLTW", "CDNS", "SNPS", "MAR", "ROP",
-            "FTNT", "ADSK", "A", "MSCI", "EXR", "PCAR", "CMI", "NXPI", "ORLY", "AZO",
-            "DLTR", "EBAY", "CHTR", "XLNX", "ALGN", "MXIM", "SWKS", "INCY", "SIRI", "WDC",
-            "NTAP", "VIAC", "DISH", "FOXA", "FOX", "GME", "AMC", "PLTR", "BB", "NOK",
-            "COIN", "HOOD", "RBLX", "SNOW", "MSTR", "RIOT", "MARA", "TSM", "ASML", "NVO",
-            "SHOP", "SQ", "ROKU", "PINS", "SNAP", "TWTR", "UBER", "LYFT", "ABNB", "DASH",
-            "ZM", "PTON", "DOCU", "CRWD", "OKTA", "DDOG", "NET", "TWLO", "SPLK", "WDAY",
-            "VEEV", "ZS", "PANW", "TEAM", "MDB", "ESTC", "FSLY", "FVRR", "UPWK", "ETSY",
-            "SPOT", "BABA", "JD", "PDD", "NIO", "XPEV", "LI"
-        ]
-        
-        for ticker in top_200_tickers:
-            if ticker in base_mentions:
-                base_count = base_mentions[ticker]
+        return self.store.dates()
+
+    def close(self):
+        """Stop extraction workers and close the mention store"""
+        if self.extraction_pool is not None:
+            self.extraction_pool.close()
+        self.store.close()
+
+    @staticmethod
+    def _period(date_str: str, granularity: str) -> str:
+        """The week (its Monday) or month (its first day) holding a date"""
+        if granularity == "week":
+            day = date.fromisoformat(date_str)
+            return (day - timedelta(days=day.weekday())).isoformat()
+        if granularity == "month":
+            return date_str[:8] + "01"
+        return date_str
+
+    @classmethod
+    def _roll_up(
+        cls, history: Iterable[Tuple[str, int]], granularity: str
+    ) -> List[Tuple[str, int]]:
+        """Sum a sorted daily series into week or month buckets"""
+        rolled = []
+        for date_str, count in history:
+            period = cls._period(date_str, granularity)
+            if rolled and rolled[-1][0] == period:
+                rolled[-1] = (period, rolled[-1][1] + count)
             else:
-                position = top_200_tickers.index(ticker) if ticker in top_200_tickers else 100
-                base_count = max(200, 1200 - (position * 4))
-            
-            for i in range(30):
-                date = (datetime.now() - timedelta(days=29-i)).strftime('%Y-%m-%d')
-                
-                volatility = random.uniform(0.7, 1.3)
-                daily_mentions = int(base_count * volatility)
-                
-                weekday = (datetime.now() - timedelta(days=29-i)).weekday()
-                if weekday >= 5:  # Saturday, Sunday
-                    daily_mentions = int(daily_mentions * 0.6)
-                
-                if date not in self.mention_data:
-                    self.mention_data[date] = {}
-                
-                self.mention_data[date][ticker] = daily_mentions
+                rolled.append((period, count))
+        return rolled
+
+    def _load_trending_from_store(self):
+        """Rebuild the trending index from counts already in the store"""
+        start = date.today() - timedelta(days=self.trending.retention_days - 1)
+        self.trending.load(
+            self.store.ticker_totals(), self.store.counts_by_date(start.isoformat())
+        )
+        self.store_snapshot = self.store.snapshot_id()
+        self.data_version += 1
+        self._notify()
+
+    def _add_counts(self, counts: Dict[str, Dict[str, int]]):
+        """Write a batch to the store and fold it into the trending index"""
+        self.store.add_counts(counts)
+        self.trending.add_counts(counts)
+        self.store_snapshot = self.store.snapshot_id()
+        self.data_version += 1
+        self._notify()
+
+    def _notify(self):
+        for listener in self.listeners:
+            try:
+                listener()
+            except Exception as e:
+                print(f"Data change listener failed: {e}")
+
+    def seed_mock_data(
+        self,
+        ticker_count: Optional[int] = None,
+        days: int = 30,
+        seed: int = 42,
+        hourly: bool = False,
+    ):
+        """Seed the store with reproducible mock data for testing purposes"""
+        generator = MockDataGenerator(
+            ticker_count=ticker_count, days=days, seed=seed, hourly=hourly
+        )
+        # Marked first, so even a partly seeded store never passes as collected
+        self.store.set_meta("mock_data", "1")
+        self.store.add_matrix(*generator.generate_matrix())
+        self._load_trending_from_store()
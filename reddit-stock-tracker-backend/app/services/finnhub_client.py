@@ -0,0 +1,117 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import TokenBucket
+
+
+class FinnhubClient:
+    """Pooled, rate-limited Finnhub quote client for bulk ticker validation.
+
+    One keep-alive ``requests.Session`` is shared by a bounded thread pool,
+    and every request first takes a token from a bucket sized to the
+    account's per-minute quota. 429 responses are retried with exponential
+    backoff, honouring ``Retry-After`` when Finnhub sends it, up to
+    ``max_retry_delay`` seconds so one lookup cannot hold a pool thread for
+    long.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://finnhub.io/api/v1",
+        max_workers: int = 8,
+        requests_per_minute: int = 60,
+        burst: Optional[int] = None,
+        max_retries: int = 4,
+        backoff: float = 1.0,
+        max_retry_delay: float = 30,
+        timeout: float = 5,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_retry_delay = max_retry_delay
+        self.timeout = timeout
+        self.rate_limiter = TokenBucket(
+            requests_per_minute,
+            burst if burst is not None else min(requests_per_minute, 30),
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def quote_is_valid(self, ticker: str) -> bool:
+        """Return True if Finnhub reports a positive current price for ticker"""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(
+                f"{self.base_url}/quote",
+                params={"symbol": ticker, "token": self.api_key},
+                timeout=self.timeout,
+            )
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            time.sleep(self._retry_delay(response, attempt))
+
+        response.raise_for_status()
+        data = response.json()
+        return "c" in data and data["c"] is not None and data["c"] > 0
+
+    def validate_many(self, tickers: Iterable[str]) -> Dict[str, Optional[bool]]:
+        """Validate distinct tickers concurrently.
+
+        Tickers whose lookup failed map to None so callers can fall back
+        without caching the failure.
+        """
+        unique = list(dict.fromkeys(tickers))
+        if not unique:
+            return {}
+
+        results = self._get_executor().map(self._safe_quote_is_valid, unique)
+        return dict(zip(unique, results))
+
+    def close(self):
+        """Shut down the worker pool and release pooled connections"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.session.close()
+
+    def _safe_quote_is_valid(self, ticker: str) -> Optional[bool]:
+        try:
+            return self.quote_is_valid(ticker)
+        except Exception as e:
+            print(f"Error validating ticker {ticker}: {e}")
+            return None
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_retry_delay)
+            except ValueError:
+                pass
+        delay = self.backoff * (2**attempt) * random.uniform(0.5, 1.5)
+        return min(delay, self.max_retry_delay)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="finnhub"
+                )
+            return self._executor
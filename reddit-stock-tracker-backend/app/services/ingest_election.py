@@ -0,0 +1,123 @@
+import os
+import threading
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+class IngestLease:
+    """Elects a single ingest worker among processes sharing one store.
+
+    The elected worker holds an exclusive ``flock`` on ``path`` for as long
+    as it lives; the OS drops the lock when the process exits, so a
+    surviving worker can take over. Other workers only read the shared
+    store, polling it for the ingest worker's writes. They forward refresh
+    requests by touching a trigger file, which the ingest worker polls.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 1.0):
+        if fcntl is None:
+            raise RuntimeError("Ingest election needs fcntl (POSIX only)")
+
+        self.path = path
+        self.trigger_path = path + ".refresh"
+        self.poll_interval = poll_interval
+        self.leader = False
+        self._file = open(path, "a+")
+        self._trigger_seen = self._trigger_mtime()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def try_acquire(self) -> bool:
+        """Take the lease if no other worker holds it"""
+        if self.leader:
+            return True
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(str(os.getpid()))
+        self._file.flush()
+        self.leader = True
+        self._trigger_seen = self._trigger_mtime()
+        return True
+
+    def holder_pid(self) -> Optional[int]:
+        """Process id of the current ingest worker, as it recorded it"""
+        try:
+            with open(self.path) as f:
+                return int(f.read().strip() or 0) or None
+        except (OSError, ValueError):
+            return None
+
+    def request_refresh(self):
+        """Ask the ingest worker to run a refresh"""
+        with open(self.trigger_path, "a"):
+            os.utime(self.trigger_path)
+
+    def start(
+        self,
+        on_elected: Callable[[], None],
+        on_refresh_request: Callable[[], None],
+        on_follow: Callable[[], None],
+    ):
+        """Poll every poll_interval seconds on a background thread.
+
+        While elected, on_refresh_request is called for each forwarded
+        request. Otherwise on_follow is called to catch up with the store,
+        and on_elected once the lease is free and this worker takes over.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._watch,
+            args=(on_elected, on_refresh_request, on_follow),
+            name="ingest-lease",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self.leader:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self.leader = False
+        self._file.close()
+
+    def _watch(
+        self,
+        on_elected: Callable[[], None],
+        on_refresh_request: Callable[[], None],
+        on_follow: Callable[[], None],
+    ):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                if not self.leader:
+                    if self.try_acquire():
+                        print(f"Worker {os.getpid()} took over ingestion")
+                        on_elected()
+                    else:
+                        on_follow()
+                    continue
+
+                mtime = self._trigger_mtime()
+                if mtime != self._trigger_seen:
+                    self._trigger_seen = mtime
+                    on_refresh_request()
+            except Exception as e:
+                print(f"Ingest lease watcher error: {e}")
+
+    def _trigger_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.trigger_path).st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from .refresh_jobs import RefreshJob
+
+
+class IngestScheduler:
+    """Periodically triggers an incremental refresh on a background thread.
+
+    Each run submits through ``submit``, which returns ``(job, created)``.
+    If a refresh is already in flight the scheduler waits on that job
+    rather than starting another, so runs never overlap. Delays are
+    randomised by ``jitter`` (a fraction of the delay) so replicas do not
+    fire in lockstep, and double after each consecutive failure up to
+    ``max_backoff`` seconds.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[], Tuple[RefreshJob, bool]],
+        interval: float = 900,
+        jitter: float = 0.1,
+        max_backoff: float = 3600,
+    ):
+        self.submit = submit
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max(max_backoff, interval)
+        self.runs = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.coalesced = 0
+        self.last_job_id: Optional[str] = None
+        self.last_status: Optional[str] = None
+        self.last_started_at: Optional[float] = None
+        self.last_finished_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.next_run_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="ingest-scheduler", daemon=True
+        )
+        self._thread.start()
+        print(f"Ingest scheduler started, every {self.interval:g}s")
+
+    def stop(self, timeout: float = 5):
+        """Stop scheduling; a refresh already running is left to finish"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def next_delay(self) -> float:
+        """Seconds until the next run, with backoff and jitter applied"""
+        delay = min(self.interval * 2**self.consecutive_failures, self.max_backoff)
+        return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def stats(self) -> Dict:
+        return {
+            "interval": self.interval,
+            "running": self._thread is not None,
+            "runs": self.runs,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "coalesced": self.coalesced,
+            "last_job_id": self.last_job_id,
+            "last_status": self.last_status,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_duration": self.last_duration,
+            "next_run_at": self.next_run_at,
+        }
+
+    def _loop(self):
+        while True:
+            delay = self.next_delay()
+            self.next_run_at = time.time() + delay
+            if self._stop.wait(delay):
+                return
+            self._run_once()
+
+    def _run_once(self):
+        self.last_started_at = time.time()
+        try:
+            job, created = self.submit()
+        except Exception as e:
+            print(f"Scheduled refresh could not start: {e}")
+            self._record("failed")
+            return
+
+        if not created:
+            self.coalesced += 1
+        self.last_job_id = job.id
+        while not job.wait(1):
+            if self._stop.is_set():
+                return
+        self._record(job.status)
+
+    def _record(self, status: str):
+        self.runs += 1
+        self.last_status = status
+        self.last_finished_at = time.time()
+        self.last_duration = self.last_finished_at - self.last_started_at
+        if status == "failed":
+            self.failures += 1
+            self.consecutive_failures += 1
+        else:
+            self.consecutive_failures = 0
@@ -0,0 +1,137 @@
+import hashlib
+import math
+import threading
+from typing import Dict, Optional
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys.
+
+    Sized for ``capacity`` keys at ``error_rate`` false positives, unless
+    that would exceed ``max_bytes``, in which case the bit array is capped
+    and the achievable false-positive rate is reported by ``error_rate_at``.
+    """
+
+    def __init__(
+        self, capacity: int, error_rate: float, max_bytes: Optional[int] = None
+    ):
+        bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        if max_bytes is not None:
+            bits = min(bits, max_bytes * 8)
+        self.capacity = capacity
+        self.num_bits = max(8, bits)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def error_rate_at(self, count: int) -> float:
+        """Expected false-positive rate once count keys have been added"""
+        return (1 - math.exp(-self.num_hashes * count / self.num_bits)) ** (
+            self.num_hashes
+        )
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+
+class ItemDeduplicator:
+    """Remembers which Reddit items were already counted, in bounded memory.
+
+    Items created within ``recent_seconds`` of the newest one seen are held
+    in an exact dict, so fresh data (where overlapping fetches and retries
+    happen) is never dropped by mistake. Every id also goes into a Bloom
+    filter that answers for older items. The filter rotates through two
+    generations of ``capacity`` ids each, so memory stays under
+    ``max_bytes`` and the oldest history is eventually forgotten rather
+    than saturating the filter.
+
+    Checking (``contains``) and recording (``record``) are separate steps,
+    so a batch's ids are only recorded once its counts have been stored.
+    """
+
+    def __init__(
+        self,
+        recent_seconds: int = 48 * 3600,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        max_bytes: int = 16 * 1024 * 1024,
+    ):
+        self.recent_seconds = recent_seconds
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_bytes = max_bytes
+        self.recent: Dict[str, int] = {}  # {key: created_utc}
+        self.newest = 0
+        self.duplicates = 0
+        self.current = self._new_filter()
+        self.previous: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+
+    def contains(self, key: str, created_utc: int) -> bool:
+        """Whether key was already recorded"""
+        with self._lock:
+            return key in self.recent or (
+                created_utc < self.newest - self.recent_seconds
+                and self._in_history(key)
+            )
+
+    def record(self, keys: Dict[str, int], duplicates: int = 0):
+        """Record {key: created_utc} once their items have been counted.
+
+        duplicates is how many items were skipped as already counted while
+        checking them, for the running total reported by ``stats``.
+        """
+        with self._lock:
+            self.duplicates += duplicates
+            for key, created_utc in keys.items():
+                self.recent[key] = created_utc
+                if created_utc > self.newest:
+                    self.newest = created_utc
+                self.current.add(key)
+                if self.current.count >= self.capacity:
+                    self.previous = self.current
+                    self.current = self._new_filter()
+
+    def prune(self):
+        """Drop exact entries that have aged out of the recent window"""
+        with self._lock:
+            cutoff = self.newest - self.recent_seconds
+            self.recent = {
+                key: created_utc
+                for key, created_utc in self.recent.items()
+                if created_utc >= cutoff
+            }
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            filters = [f for f in (self.current, self.previous) if f is not None]
+            return {
+                "duplicates": self.duplicates,
+                "recent_size": len(self.recent),
+                "history_size": sum(f.count for f in filters),
+                "filter_bytes": sum(len(f.bits) for f in filters),
+                "false_positive_rate": max(f.error_rate_at(f.count) for f in filters),
+            }
+
+    def _in_history(self, key: str) -> bool:
+        return key in self.current or (
+            self.previous is not None and key in self.previous
+        )
+
+    def _new_filter(self) -> BloomFilter:
+        # Two generations are alive at once, so each gets half the budget
+        return BloomFilter(self.capacity, self.error_rate, self.max_bytes // 2)
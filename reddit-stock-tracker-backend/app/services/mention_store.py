@@ -0,0 +1,547 @@
+import bisect
+import sqlite3
+import threading
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the columnar store
+    np = None
+
+
+class MentionStore:
+    """Storage interface for daily ticker mention counts.
+
+    Dates are ISO ``YYYY-MM-DD`` strings and tickers are uppercase symbols.
+    Counts are only ever added in batches shaped ``{date: {ticker: count}}``
+    so backends can apply a whole ingest batch at once.
+    """
+
+    # Whether counts survive a process restart
+    persistent = False
+
+    def add_counts(self, counts: Dict[str, Dict[str, int]]):
+        """Add a batch of {date: {ticker: count}} to the stored totals"""
+        raise NotImplementedError
+
+    def add_matrix(self, dates: List[str], tickers: List[str], counts):
+        """Add a dense (dates x tickers) block of counts.
+
+        counts may be a numpy array or a list of rows. Backends that can
+        ingest the block directly override this; the default goes through
+        add_counts.
+        """
+        if hasattr(counts, "tolist"):
+            counts = counts.tolist()
+        self.add_counts(
+            {
+                date_str: dict(zip(tickers, row))
+                for date_str, row in zip(dates, counts)
+            }
+        )
+
+    def ticker_totals(self) -> Dict[str, int]:
+        """Total mentions per ticker across all dates"""
+        raise NotImplementedError
+
+    def ticker_history(
+        self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """(date, count) for every stored date in [start, end], zero-filled"""
+        raise NotImplementedError
+
+    def history_matrix(
+        self, tickers: List[str], start: Optional[str] = None, end: Optional[str] = None
+    ) -> Tuple[List[str], Dict[str, List[int]]]:
+        """Stored dates in [start, end] and each ticker's counts on them.
+
+        Every series is zero-filled and aligned to the returned date axis.
+        Backends override this to answer a whole batch in one lookup; the
+        default falls back to one ticker_history call per ticker.
+        """
+        all_dates = self.dates()
+        lo, hi = _date_bounds(all_dates, start, end)
+        dates = all_dates[lo:hi]
+        series = {
+            ticker: [count for _, count in self.ticker_history(ticker, start, end)]
+            for ticker in tickers
+        }
+        return dates, series
+
+    def dates(self) -> List[str]:
+        """All stored dates in order"""
+        raise NotImplementedError
+
+    def counts_by_date(self, start: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Nonzero {date: {ticker: count}} for dates on or after start"""
+        raise NotImplementedError
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """A bookkeeping value kept alongside the counts, if set"""
+        return self._meta.get(key)
+
+    def set_meta(self, key: str, value: str):
+        self._meta[key] = value
+
+    def snapshot_id(self) -> Optional[Tuple[str, int]]:
+        """(store id, write count) naming the stored data, for durable stores.
+
+        Every process opening the same durable store reads the same value,
+        so it can version cached responses across workers. None otherwise.
+        """
+        return None
+
+    def change_token(self):
+        """A value that changes when another process writes to the store.
+
+        Only meaningful for stores shared between processes; others return
+        None, and a process always sees its own writes directly.
+        """
+        return None
+
+    def close(self):
+        """Release any resources held by the store"""
+
+
+class DictMentionStore(MentionStore):
+    """Nested dict store: {date: {ticker: count}}
+
+    Alongside the nested dict it keeps a sorted list of all dates and, per
+    ticker, a sorted (dates, counts) series, so a history range query is two
+    bisects plus a merge over the points returned.
+    """
+
+    def __init__(self):
+        self.mention_data = defaultdict(lambda: defaultdict(int))
+        self.date_list: List[str] = []
+        self.series: Dict[str, Tuple[List[str], List[int]]] = {}
+        self._meta: Dict[str, str] = {}
+
+    def add_counts(self, counts: Dict[str, Dict[str, int]]):
+        for date_str, ticker_counts in counts.items():
+            if date_str not in self.mention_data:
+                self._insert_sorted(self.date_list, date_str)
+            date_data = self.mention_data[date_str]
+            for ticker, count in ticker_counts.items():
+                date_data[ticker] += count
+                self._add_point(ticker, date_str, count)
+
+    def ticker_totals(self) -> Dict[str, int]:
+        ticker_totals = defaultdict(int)
+        for date_data in self.mention_data.values():
+            for ticker, count in date_data.items():
+                ticker_totals[ticker] += count
+        return dict(ticker_totals)
+
+    def ticker_history(
+        self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        lo, hi = _date_bounds(self.date_list, start, end)
+        dates = self.date_list[lo:hi]
+        series = self.series.get(ticker)
+        if series is None or not dates:
+            return [(date_str, 0) for date_str in dates]
+
+        series_dates, series_counts = series
+        i = bisect.bisect_left(series_dates, dates[0])
+        history = []
+        for date_str in dates:
+            if i < len(series_dates) and series_dates[i] == date_str:
+                history.append((date_str, series_counts[i]))
+                i += 1
+            else:
+                history.append((date_str, 0))
+        return history
+
+    def history_matrix(
+        self, tickers: List[str], start: Optional[str] = None, end: Optional[str] = None
+    ) -> Tuple[List[str], Dict[str, List[int]]]:
+        lo, hi = _date_bounds(self.date_list, start, end)
+        dates = self.date_list[lo:hi]
+        series = {}
+        for ticker in tickers:
+            date_data = (self.mention_data.get(date_str, {}) for date_str in dates)
+            series[ticker] = [counts.get(ticker, 0) for counts in date_data]
+        return dates, series
+
+    def dates(self) -> List[str]:
+        return list(self.date_list)
+
+    def counts_by_date(self, start: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        lo, hi = _date_bounds(self.date_list, start, None)
+        return {
+            date_str: {
+                ticker: count
+                for ticker, count in self.mention_data[date_str].items()
+                if count
+            }
+            for date_str in self.date_list[lo:hi]
+        }
+
+    def _add_point(self, ticker: str, date_str: str, count: int):
+        series_dates, series_counts = self.series.setdefault(ticker, ([], []))
+        if not series_dates or series_dates[-1] < date_str:
+            series_dates.append(date_str)
+            series_counts.append(count)
+            return
+
+        i = bisect.bisect_left(series_dates, date_str)
+        if series_dates[i] == date_str:
+            series_counts[i] += count
+        else:
+            series_dates.insert(i, date_str)
+            series_counts.insert(i, count)
+
+    @staticmethod
+    def _insert_sorted(dates: List[str], date_str: str):
+        if not dates or dates[-1] < date_str:
+            dates.append(date_str)
+        else:
+            bisect.insort(dates, date_str)
+
+
+class ColumnarMentionStore(MentionStore):
+    """Array-backed store: an int32 (days x tickers) matrix.
+
+    Tickers and dates are interned to column and row indexes. Capacity
+    doubles along whichever axis runs out, so appending a new day or a new
+    ticker is amortized O(1) per cell. Totals are a vectorized column sum,
+    and a ticker's history is a single column slice.
+    """
+
+    def __init__(self, day_capacity: int = 32, ticker_capacity: int = 256):
+        if np is None:
+            raise ImportError("ColumnarMentionStore requires numpy")
+
+        self.counts = np.zeros((day_capacity, ticker_capacity), dtype=np.int32)
+        self.ticker_index: Dict[str, int] = {}
+        self.tickers: List[str] = []
+        self.date_index: Dict[str, int] = {}
+        self.date_labels: List[str] = []
+        self._date_order = []  # row permutation sorting date_labels
+        self._sorted_dates: List[str] = []  # date_labels in _date_order
+        self._meta: Dict[str, str] = {}
+
+    def add_counts(self, counts: Dict[str, Dict[str, int]]):
+        rows = []
+        columns = []
+        values = []
+        for date_str, ticker_counts in counts.items():
+            row = self._intern_date(date_str)
+            for ticker, count in ticker_counts.items():
+                rows.append(row)
+                columns.append(self._intern_ticker(ticker))
+                values.append(count)
+
+        if values:
+            np.add.at(self.counts, (rows, columns), values)
+
+    def add_matrix(self, dates: List[str], tickers: List[str], counts):
+        rows = [self._intern_date(date_str) for date_str in dates]
+        columns = [self._intern_ticker(ticker) for ticker in tickers]
+        self.counts[np.ix_(rows, columns)] += np.asarray(counts, dtype=np.int32)
+
+    def ticker_totals(self) -> Dict[str, int]:
+        totals = self._totals()
+        return dict(zip(self.tickers, totals.tolist()))
+
+    def ticker_history(
+        self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        order = self._sorted_rows()
+        lo, hi = _date_bounds(self._sorted_dates, start, end)
+        dates = self._sorted_dates[lo:hi]
+        column = self.ticker_index.get(ticker)
+        if column is None:
+            return [(date_str, 0) for date_str in dates]
+
+        series = self.counts[order[lo:hi], column].tolist()
+        return list(zip(dates, series))
+
+    def history_matrix(
+        self, tickers: List[str], start: Optional[str] = None, end: Optional[str] = None
+    ) -> Tuple[List[str], Dict[str, List[int]]]:
+        order = self._sorted_rows()
+        lo, hi = _date_bounds(self._sorted_dates, start, end)
+        dates = self._sorted_dates[lo:hi]
+        known = [ticker for ticker in tickers if ticker in self.ticker_index]
+        columns = [self.ticker_index[ticker] for ticker in known]
+
+        # One gather of the (dates x tickers) block, then one row per ticker
+        block = self.counts[np.ix_(order[lo:hi], columns)].T.tolist()
+        series = {ticker: [0] * len(dates) for ticker in tickers}
+        series.update(zip(known, block))
+        return dates, series
+
+    def dates(self) -> List[str]:
+        self._sorted_rows()
+        return list(self._sorted_dates)
+
+    def counts_by_date(self, start: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        order = self._sorted_rows()
+        lo, hi = _date_bounds(self._sorted_dates, start, None)
+        counts = {}
+        for row, date_str in zip(order[lo:hi], self._sorted_dates[lo:hi]):
+            values = self.counts[row, : len(self.tickers)]
+            columns = np.flatnonzero(values).tolist()
+            counts[date_str] = {
+                self.tickers[column]: int(values[column]) for column in columns
+            }
+        return counts
+
+    def _totals(self):
+        return self.counts[: len(self.date_labels), : len(self.tickers)].sum(
+            axis=0, dtype=np.int64
+        )
+
+    def _sorted_rows(self) -> List[int]:
+        if self._date_order is None:
+            self._date_order = sorted(
+                range(len(self.date_labels)), key=self.date_labels.__getitem__
+            )
+            self._sorted_dates = [self.date_labels[row] for row in self._date_order]
+        return self._date_order
+
+    def _intern_date(self, date_str: str) -> int:
+        row = self.date_index.get(date_str)
+        if row is None:
+            row = len(self.date_labels)
+            if row == self.counts.shape[0]:
+                self._grow(rows=max(row * 2, 1))
+            order = self._date_order
+            if order is not None:
+                if order and date_str < self._sorted_dates[-1]:
+                    self._date_order = None
+                else:
+                    order.append(row)
+                    self._sorted_dates.append(date_str)
+            self.date_index[date_str] = row
+            self.date_labels.append(date_str)
+        return row
+
+    def _intern_ticker(self, ticker: str) -> int:
+        column = self.ticker_index.get(ticker)
+        if column is None:
+            column = len(self.tickers)
+            if column == self.counts.shape[1]:
+                self._grow(columns=max(column * 2, 1))
+            self.ticker_index[ticker] = column
+            self.tickers.append(ticker)
+        return column
+
+    def _grow(self, rows: int = 0, columns: int = 0):
+        current_rows, current_columns = self.counts.shape
+        grown = np.zeros(
+            (max(rows, current_rows), max(columns, current_columns)), dtype=np.int32
+        )
+        grown[:current_rows, :current_columns] = self.counts
+        self.counts = grown
+
+
+class SQLiteMentionStore(MentionStore):
+    """Durable store backed by a stdlib sqlite3 database file.
+
+    The database runs in WAL mode so readers never block the ingest writer.
+    Each add_counts batch is one transaction of executemany upserts into the
+    per-day counts, the set of known dates and a per-ticker running totals
+    table. The (ticker, date, count) index covers history range queries, and
+    the totals table lets the trending index load with a read of one small
+    table rather than an aggregate over history.
+
+    Several processes can open the same file: one writes while the others
+    read, with pages memory-mapped (up to ``mmap_size`` bytes) so readers
+    are served straight from the shared OS page cache.
+    """
+
+    persistent = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS mentions (
+            date TEXT NOT NULL,
+            ticker TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (date, ticker)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS mentions_ticker_date
+            ON mentions (ticker, date, count);
+        CREATE TABLE IF NOT EXISTS dates (
+            date TEXT PRIMARY KEY
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS ticker_totals (
+            ticker TEXT PRIMARY KEY,
+            total INTEGER NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: str = "mentions.db", mmap_size: int = 256 * 1024 * 1024):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.executescript(self.SCHEMA)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('store_id', ?)",
+                (uuid.uuid4().hex[:8],),
+            )
+        self._lock = threading.Lock()
+
+    def add_counts(self, counts: Dict[str, Dict[str, int]]):
+        rows = []
+        totals = defaultdict(int)
+        for date_str, ticker_counts in counts.items():
+            for ticker, count in ticker_counts.items():
+                rows.append((date_str, ticker, count))
+                totals[ticker] += count
+
+        if not rows:
+            return
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO dates (date) VALUES (?)",
+                [(date_str,) for date_str in counts],
+            )
+            self.conn.executemany(
+                "INSERT INTO mentions (date, ticker, count) VALUES (?, ?, ?) "
+                "ON CONFLICT (date, ticker) DO UPDATE "
+                "SET count = count + excluded.count",
+                rows,
+            )
+            self.conn.executemany(
+                "INSERT INTO ticker_totals (ticker, total) VALUES (?, ?) "
+                "ON CONFLICT (ticker) DO UPDATE SET total = total + excluded.total",
+                totals.items(),
+            )
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('writes', 1) "
+                "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+            )
+
+    def ticker_totals(self) -> Dict[str, int]:
+        return dict(self._query("SELECT ticker, total FROM ticker_totals"))
+
+    def ticker_history(
+        self, ticker: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        where, params = self._where(start, end)
+        dates = self._query(f"SELECT date FROM dates{where} ORDER BY date", params)
+
+        where, params = self._where(start, end, ticker)
+        points = dict(self._query(f"SELECT date, count FROM mentions{where}", params))
+        return [(date_str, points.get(date_str, 0)) for (date_str,) in dates]
+
+    def history_matrix(
+        self, tickers: List[str], start: Optional[str] = None, end: Optional[str] = None
+    ) -> Tuple[List[str], Dict[str, List[int]]]:
+        where, params = self._where(start, end)
+        sql = f"SELECT date FROM dates{where} ORDER BY date"
+        dates = [row[0] for row in self._query(sql, params)]
+        series = {ticker: [0] * len(dates) for ticker in tickers}
+        if not dates or not tickers:
+            return dates, series
+
+        placeholders = ", ".join("?" * len(series))
+        clause = f"ticker IN ({placeholders})"
+        where = f"{where} AND {clause}" if where else f" WHERE {clause}"
+        position = {date_str: i for i, date_str in enumerate(dates)}
+        for date_str, ticker, count in self._query(
+            f"SELECT date, ticker, count FROM mentions{where}", params + tuple(series)
+        ):
+            series[ticker][position[date_str]] = count
+        return dates, series
+
+    def dates(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT date FROM dates ORDER BY date")]
+
+    def counts_by_date(self, start: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        where, params = self._where(start, None)
+        counts = defaultdict(dict)
+        for date_str, ticker, count in self._query(
+            f"SELECT date, ticker, count FROM mentions{where}", params
+        ):
+            if count:
+                counts[date_str][ticker] = count
+        return dict(counts)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        rows = self._query("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def snapshot_id(self) -> Tuple[str, int]:
+        meta = dict(
+            self._query(
+                "SELECT key, value FROM meta WHERE key IN ('store_id', 'writes')"
+            )
+        )
+        return meta["store_id"], int(meta.get("writes", 0))
+
+    def change_token(self) -> int:
+        # Bumped whenever another connection commits to the database
+        return self._query("PRAGMA data_version")[0][0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _where(
+        start: Optional[str], end: Optional[str], ticker: Optional[str] = None
+    ) -> Tuple[str, tuple]:
+        """WHERE clause and parameters for an optional ticker and date range"""
+        clauses = []
+        params = []
+        if ticker is not None:
+            clauses.append("ticker = ?")
+            params.append(ticker)
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("date <= ?")
+            params.append(end)
+        if not clauses:
+            return "", ()
+        return " WHERE " + " AND ".join(clauses), tuple(params)
+
+
+def _date_bounds(
+    dates: List[str], start: Optional[str], end: Optional[str]
+) -> Tuple[int, int]:
+    """Slice bounds of the sorted ISO dates falling within [start, end]"""
+    lo = bisect.bisect_left(dates, start) if start is not None else 0
+    hi = bisect.bisect_right(dates, end) if end is not None else len(dates)
+    return lo, hi
+
+
+def create_mention_store(
+    kind: str = "dict", path: Optional[str] = None
+) -> MentionStore:
+    """Build a mention store by name"""
+    if kind == "dict":
+        return DictMentionStore()
+    if kind == "columnar":
+        return ColumnarMentionStore()
+    if kind == "sqlite":
+        return SQLiteMentionStore(path or "mentions.db")
+    raise ValueError(f"Unknown mention store: {kind}")
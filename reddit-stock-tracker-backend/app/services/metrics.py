@@ -0,0 +1,299 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond API hits to slow fetches
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60,
+)
+
+
+class Metric:
+    """A named family of samples, one per combination of label values.
+
+    Updates take a per-metric lock around a couple of additions, so the
+    instrumentation stays cheap enough for the ingest and request paths.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> "LabeledMetric":
+        """The child for one combination of label values; cache it if hot"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return LabeledMetric(self, tuple(str(value) for value in values))
+
+    def samples(self) -> List[Tuple[str, Tuple[str, ...], float]]:
+        """(suffix, label values, value) for every sample in the family"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for suffix, labels, value in self.samples():
+            labels = self._format_labels(labels)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+    def _format_labels(self, values: Tuple[str, ...]) -> str:
+        names = self.labelnames + ("le",) * (len(values) - len(self.labelnames))
+        if not values:
+            return ""
+        pairs = ",".join(
+            f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+        )
+        return "{" + pairs + "}"
+
+
+class LabeledMetric:
+    """A metric bound to fixed label values"""
+
+    __slots__ = ("metric", "values")
+
+    def __init__(self, metric: Metric, values: Tuple[str, ...]):
+        self.metric = metric
+        self.values = values
+
+    def inc(self, amount: float = 1):
+        self.metric._inc(self.values, amount)
+
+    def set(self, value: float):
+        self.metric._set(self.values, value)
+
+    def observe(self, value: float):
+        self.metric._observe(self.values, value)
+
+    def time(self):
+        return self.metric._time(self.values)
+
+
+class Counter(Metric):
+    """A monotonically increasing total"""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1):
+        self._inc((), amount)
+
+    def _inc(self, labels: Tuple[str, ...], amount: float):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [("", labels, value) for labels, value in self._values.items()]
+
+
+class Gauge(Metric):
+    """A value that can go up and down"""
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float):
+        self._set((), value)
+
+    def _set(self, labels: Tuple[str, ...], value: float):
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self):
+        with self._lock:
+            return [("", labels, value) for labels, value in self._values.items()]
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, with their sum"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # {labels: [per-bucket counts (+Inf last), sum]}
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float):
+        self._observe((), value)
+
+    def time(self):
+        return self._time(())
+
+    def _observe(self, labels: Tuple[str, ...], value: float):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][i] += 1
+            entry[1] += value
+
+    @contextmanager
+    def _time(self, labels: Tuple[str, ...]) -> Iterator[None]:
+        """Observe the wall time spent in the with block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._observe(labels, time.perf_counter() - start)
+
+    def samples(self):
+        with self._lock:
+            values = [
+                (labels, list(counts), total)
+                for labels, (counts, total) in self._values.items()
+            ]
+
+        samples = []
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                samples.append(("_bucket", labels + (bound,), cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, cumulative))
+        return samples
+
+
+class Registry:
+    """The set of metrics exposed on /metrics.
+
+    Collectors registered with ``on_collect`` run just before each render,
+    so values that are already tracked elsewhere (cache statistics, store
+    size) are read at scrape time instead of on every update.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing  # module reloads reuse the first instance
+            self._metrics[metric.name] = metric
+            return metric
+
+    def on_collect(self, collector: Callable[[], None]):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics.values())
+
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                print(f"Metrics collector failed: {e}")
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help, labelnames))
+
+
+def gauge(name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, help, labelnames))
+
+
+def histogram(
+    name: str,
+    help: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, help, labelnames, buckets))
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording request latency and status per route.
+
+    Requests are labelled with the matched route template (for example
+    ``/api/ticker/{ticker}/history``) rather than the raw path, so the
+    number of series stays bounded. Streaming responses are timed until
+    the stream ends.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.latency = histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route",
+            ("method", "route"),
+        )
+        self.responses = counter(
+            "http_responses_total",
+            "HTTP responses by route and status code",
+            ("method", "route", "status"),
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            self.latency.labels(method, route).observe(time.perf_counter() - start)
+            self.responses.labels(method, route, status).inc()
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,135 @@
+import random
+from datetime import date, timedelta
+from itertools import product
+from string import ascii_uppercase
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # fall back to the pure-Python generator
+    np = None
+
+from .ticker_universe import get_ticker_universe
+
+# Hand-tuned daily mention levels for the tickers Reddit talks about most
+BASE_MENTIONS = {
+    'AAPL': 2500, 'MSFT': 2200, 'GOOGL': 2000, 'GOOG': 2000, 'AMZN': 1900,
+    'NVDA': 2800, 'TSLA': 3000, 'META': 1800, 'BRK.B': 1200, 'BRK.A': 800,
+
+    'V': 1000, 'JPM': 1100, 'JNJ': 900, 'WMT': 800, 'PG': 700,
+    'UNH': 900, 'HD': 800, 'MA': 950, 'BAC': 1200, 'XOM': 1100,
+
+    'GME': 2500, 'AMC': 2000, 'PLTR': 1500, 'BB': 1200, 'NOK': 1000,
+    'COIN': 1800, 'HOOD': 1400, 'RBLX': 1300, 'SNOW': 1100,
+}
+
+# Relative share of a day's mentions posted in each hour (US-market heavy)
+HOURLY_PROFILE = [
+    1, 1, 1, 1, 1, 1, 2, 3, 4, 5, 6, 6,
+    6, 6, 6, 6, 5, 5, 4, 4, 3, 3, 2, 2,
+]
+
+WEEKEND_FACTOR = 0.6
+
+
+class MockDataGenerator:
+    """Seeded synthetic mention volumes for the ranked ticker universe.
+
+    Each ticker gets a base daily level (``BASE_MENTIONS``, or a level that
+    decays with its rank), scaled per cell by a uniform 0.7-1.3 volatility
+    and damped on weekends. With ``hourly`` each day is drawn as 24 hours
+    following ``HOURLY_PROFILE``, each with its own volatility, and summed
+    back into the daily buckets the stores hold.
+
+    With numpy the whole (periods x tickers) matrix is drawn in one
+    vectorized call; without it a seeded pure-Python loop produces the same
+    distribution. The two draw from different generators, so a seed is
+    reproducible within one backend but gives different numbers across them.
+    """
+
+    def __init__(
+        self,
+        ticker_count: Optional[int] = None,
+        days: int = 30,
+        seed: int = 42,
+        hourly: bool = False,
+        end: Optional[date] = None,
+    ):
+        self.tickers = self._ticker_symbols(ticker_count)
+        self.days = days
+        self.seed = seed
+        self.hourly = hourly
+        self.end = end or date.today()
+
+    def generate_matrix(self) -> Tuple[List[str], List[str], object]:
+        """Return (ISO dates, tickers, counts) with counts days x tickers.
+
+        Counts are an int32 ndarray with numpy, else a list of row lists;
+        hourly draws are already summed per day.
+        """
+        days = [self.end - timedelta(days=self.days - 1 - i) for i in range(self.days)]
+        base = [
+            self._base_count(rank, ticker) for rank, ticker in enumerate(self.tickers)
+        ]
+
+        labels = [day.isoformat() for day in days]
+        scales = [WEEKEND_FACTOR if day.weekday() >= 5 else 1.0 for day in days]
+        if self.hourly:
+            total_weight = sum(HOURLY_PROFILE)
+            scales = [
+                scale * weight / total_weight
+                for scale in scales
+                for weight in HOURLY_PROFILE
+            ]
+
+        if np is not None:
+            rng = np.random.default_rng(self.seed)
+            volatility = rng.uniform(0.7, 1.3, size=(len(scales), len(base)))
+            counts = np.floor(
+                np.asarray(base, dtype=np.float64)
+                * volatility
+                * np.asarray(scales)[:, None]
+            ).astype(np.int32)
+            if self.hourly:
+                counts = counts.reshape(len(days), len(HOURLY_PROFILE), -1).sum(
+                    axis=1, dtype=np.int32
+                )
+            return labels, self.tickers, counts
+
+        rng = random.Random(self.seed)
+        counts = [
+            [int(level * rng.uniform(0.7, 1.3) * scale) for level in base]
+            for scale in scales
+        ]
+        if self.hourly:
+            hours = len(HOURLY_PROFILE)
+            counts = [
+                [sum(column) for column in zip(*counts[i : i + hours])]
+                for i in range(0, len(counts), hours)
+            ]
+        return labels, self.tickers, counts
+
+    @staticmethod
+    def _base_count(rank: int, ticker: str) -> int:
+        if ticker in BASE_MENTIONS:
+            return BASE_MENTIONS[ticker]
+        return max(200, 1200 - (rank * 4))
+
+    @staticmethod
+    def _ticker_symbols(ticker_count: Optional[int]) -> List[str]:
+        """The ranked universe, padded with synthetic symbols if needed"""
+        tickers = list(get_ticker_universe().tickers)
+        if ticker_count is None:
+            return tickers
+        if ticker_count <= len(tickers):
+            return tickers[:ticker_count]
+
+        known = set(tickers)
+        for length in range(3, 5):
+            for letters in product(ascii_uppercase, repeat=length):
+                symbol = "Z" + "".join(letters)
+                if symbol not in known:
+                    tickers.append(symbol)
+                    if len(tickers) == ticker_count:
+                        return tickers
+        raise ValueError(f"Cannot generate {ticker_count} ticker symbols")
@@ -0,0 +1,110 @@
+import math
+import multiprocessing
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .ticker_extractor import TickerExtractor
+from .ticker_universe import TickerUniverse, get_ticker_universe
+
+# Chunks per worker per batch; more chunks even out uneven item lengths
+CHUNKS_PER_WORKER = 4
+
+_worker_state: Optional[Tuple[TickerExtractor, TickerUniverse]] = None
+
+
+def count_candidates(
+    pairs: List[Tuple[str, str]],
+    extractor: TickerExtractor,
+    universe: Optional[TickerUniverse] = None,
+) -> Dict[str, Counter]:
+    """Count candidate tickers per date over (date, text) pairs.
+
+    Each item contributes at most one mention per ticker, as in the serial
+    ingest path.
+    """
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    for date_str, text in pairs:
+        tickers = extractor.extract_candidates(text, universe)
+        if tickers:
+            counts[date_str].update(tickers)
+    return dict(counts)
+
+
+def _init_worker(engine: str, universe: TickerUniverse):
+    global _worker_state
+    _worker_state = (TickerExtractor(engine), universe)
+
+
+def _count_chunk(pairs: List[Tuple[str, str]]) -> Dict[str, Counter]:
+    extractor, universe = _worker_state
+    return count_candidates(pairs, extractor, universe)
+
+
+class ExtractionPool:
+    """Process pool that runs candidate extraction across CPU cores.
+
+    Workers are spawned once and get the parent's engine and ticker
+    universe; the pool is rebuilt if either changes (e.g. a universe hot
+    reload). Chunks are mapped in order and their partial ``{date: Counter}``
+    aggregates merged in that order, so results match ``count_candidates``
+    run serially over the same pairs.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = None
+        self._built_for = None  # (engine, universe) the workers were given
+        self._lock = threading.Lock()
+
+    def count(
+        self, pairs: List[Tuple[str, str]], extractor: TickerExtractor
+    ) -> Dict[str, Counter]:
+        if not pairs:
+            return {}
+
+        chunk_size = math.ceil(len(pairs) / (self.workers * CHUNKS_PER_WORKER))
+        chunks = [
+            pairs[start : start + chunk_size]
+            for start in range(0, len(pairs), chunk_size)
+        ]
+
+        merged: Dict[str, Counter] = {}
+        executor = self._get_executor(extractor.engine, get_ticker_universe())
+        for partial in executor.map(_count_chunk, chunks):
+            for date_str, counter in partial.items():
+                if date_str in merged:
+                    merged[date_str].update(counter)
+                else:
+                    merged[date_str] = counter
+        return merged
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._built_for = None
+
+    def _get_executor(
+        self, engine: str, universe: TickerUniverse
+    ) -> ProcessPoolExecutor:
+        with self._lock:
+            built_for = self._built_for
+            if (
+                self._executor is None
+                or built_for[0] != engine
+                or built_for[1] is not universe
+            ):
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                # spawn, not fork: the API process runs threads of its own
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(engine, universe),
+                )
+                self._built_for = (engine, universe)
+            return self._executor
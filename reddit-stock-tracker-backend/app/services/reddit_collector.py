@@ -1,45 +1,210 @@
-from pmaw import PushshiftAPI
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import Iterator, List, Optional
+
+from pmaw import PushshiftAPI
+
+from . import metrics
+from .rate_limiter import TokenBucket
+from .reddit_item import DEFAULT_SUBREDDITS, FIELDS, RedditItem
+from .watermarks import WatermarkStore, default_watermark_path
+
+FETCH_KINDS = ("submission", "comment")
+
+COLLECT_SECONDS = metrics.histogram(
+    "reddit_collect_seconds",
+    "Time to fetch one subreddit source",
+    ("subreddit", "kind"),
+)
+COLLECTED_ITEMS = metrics.counter(
+    "reddit_collected_items_total",
+    "New items fetched per subreddit source",
+    ("subreddit", "kind"),
+)
+COLLECT_ERRORS = metrics.counter(
+    "reddit_collect_errors_total",
+    "Failed fetches per subreddit source",
+    ("subreddit", "kind"),
+)
+
+
+def _ignore_signals():
+    pass
+
+
+class SharedBudgetPushshiftAPI(PushshiftAPI):
+    """PushshiftAPI whose requests draw on a budget shared between instances.
+
+    pmaw keeps per-search state on the API object, so concurrent searches
+    each need their own instance. Every request first takes a token from a
+    shared bucket and holds one of a shared set of connection slots, which
+    keeps the collector as a whole within its rate limit and concurrency cap.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: TokenBucket,
+        connection_slots: threading.Semaphore,
+        base_url: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+        self.connection_slots = connection_slots
+        if base_url:
+            self._base_url = base_url.rstrip("/") + "/{{endpoint}}"
+
+    def _impose_rate_limit(self):
+        self.rate_limiter.acquire()
+
+    def _multithread(self, check_total=False):
+        # pmaw installs SIGINT/SIGTERM handlers on every search, which fails
+        # off the main thread and would displace the server's own handlers
+        self.req.check_sigs = _ignore_signals
+        return super()._multithread(check_total)
+
+    def _get(self, url, payload=None):
+        with self.connection_slots:
+            return super()._get(url, payload or {})
 
 
 class RedditCollector:
-    def __init__(self):
-        self.api = PushshiftAPI(num_workers=10, rate_limit=60)
-        self.subreddits = ["wallstreetbets", "stocks", "investing", "SecurityAnalysis"]
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        num_workers: int = 10,
+        rate_limit: int = 60,
+        watermarks: Optional[WatermarkStore] = None,
+    ):
+        self.subreddits = list(DEFAULT_SUBREDDITS)
+        self.limits = {"submission": 1000, "comment": 5000}
+        self.base_url = base_url or os.getenv("PUSHSHIFT_BASE_URL")
+        # Sources fetched at once; requests in flight are capped by num_workers
+        self.max_workers = max_workers or int(os.getenv("COLLECTOR_MAX_WORKERS", "4"))
+        self.num_workers = num_workers
+        self.rate_limiter = TokenBucket(rate_limit, num_workers)
+        self.connection_slots = threading.BoundedSemaphore(num_workers)
+        self.watermarks = watermarks or WatermarkStore(
+            default_watermark_path(), int(os.getenv("WATERMARK_OVERLAP", "300"))
+        )
+        # Outcome of the last iter_recent_data, once it has been consumed
+        self.sources_attempted = 0
+        self.failed_sources: List[str] = []
 
-    def collect_recent_data(self, days_back: int = 30) -> List[Dict]:
+    def collect_recent_data(self, days_back: int = 30) -> List[RedditItem]:
         """Collect submissions and comments from the last N days"""
+        all_data = list(self.iter_recent_data(days_back))
+        print(f"Total collected: {len(all_data)} items")
+        return all_data
+
+    def iter_recent_data(self, days_back: int = 30) -> Iterator[RedditItem]:
+        """Yield submissions and comments from the last N days as they arrive
+
+        Every (subreddit, kind) source is fetched concurrently and handed on
+        as soon as it completes. A failing source is logged, skipped without
+        affecting the others and listed in ``failed_sources``. Sources with
+        a watermark only fetch what is newer than it, so each item is yielded
+        once across calls; commit and save ``self.watermarks`` once the
+        items have been stored.
+        """
         end_time = int(datetime.now().timestamp())
         start_time = int((datetime.now() - timedelta(days=days_back)).timestamp())
+        plan = [
+            (subreddit, kind) for subreddit in self.subreddits for kind in FETCH_KINDS
+        ]
+        self.sources_attempted = len(plan)
+        self.failed_sources = []
 
-        all_data = []
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(plan)),
+            thread_name_prefix="collector",
+        )
+        try:
+            futures = {}
+            for subreddit, kind in plan:
+                future = executor.submit(
+                    self._fetch, subreddit, kind, start_time, end_time
+                )
+                futures[future] = (subreddit, kind)
 
-        for subreddit in self.subreddits:
-            try:
-                print(f"Collecting data from r/{subreddit}...")
+            for future in as_completed(futures):
+                subreddit, kind = futures.pop(future)
+                try:
+                    items = future.result()
+                except Exception as e:
+                    print(f"Error collecting {kind}s from r/{subreddit}: {e}")
+                    COLLECT_ERRORS.labels(subreddit, kind).inc()
+                    self.failed_sources.append(f"{subreddit}/{kind}")
+                    continue
 
-                submissions = self.api.search_submissions(
-                    subreddit=subreddit, after=start_time, before=end_time, limit=1000
-                )
+                print(f"Collected {len(items)} {kind}s from r/{subreddit}")
+                COLLECTED_ITEMS.labels(subreddit, kind).inc(len(items))
+                yield from items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                comments = self.api.search_comments(
-                    subreddit=subreddit, after=start_time, before=end_time, limit=5000
-                )
+    def _fetch(
+        self, subreddit: str, kind: str, start_time: int, end_time: int
+    ) -> List[RedditItem]:
+        """Run one timed subreddit search"""
+        with COLLECT_SECONDS.labels(subreddit, kind).time():
+            return self._search(subreddit, kind, start_time, end_time)
 
-                all_data.extend([item for item in submissions])
-                all_data.extend([item for item in comments])
+    def _search(
+        self, subreddit: str, kind: str, start_time: int, end_time: int
+    ) -> List[RedditItem]:
+        """Run one subreddit search on its own API instance
 
-                submission_count = len([item for item in submissions])
-                comment_count = len([item for item in comments])
-                print(
-                    f"Collected {submission_count} submissions and "
-                    f"{comment_count} comments from r/{subreddit}"
+        Only the fields in ``FIELDS`` are requested, and results are kept as
+        compact RedditItem records rather than Reddit JSON dicts. A search
+        that hits the source's limit returns only part of the window, so the
+        rest is requested page by page, each ending at the oldest item of the
+        previous one. The watermark then moves past a fully covered window
+        only, and never leaves a gap behind it.
+        """
+        source = f"{subreddit}/{kind}"
+        start_time = self.watermarks.start_time(source, start_time)
+        print(f"Collecting {kind}s from r/{subreddit}...")
+        # pmaw splits the window into batch_size slices up front, one request
+        # each; a short catch-up window since the watermark needs only one
+        window_days = (end_time - start_time) // (24 * 3600)
+        api = SharedBudgetPushshiftAPI(
+            self.rate_limiter,
+            self.connection_slots,
+            self.base_url,
+            num_workers=self.num_workers,
+            batch_size=max(1, min(self.num_workers, window_days)),
+        )
+        search = api.search_submissions if kind == "submission" else api.search_comments
+        limit = self.limits[kind]
+
+        items = {}  # {id: item}, as pages overlap on their boundary second
+        until = end_time
+        while True:
+            page = list(
+                search(
+                    subreddit=subreddit,
+                    since=start_time,
+                    until=until,
+                    limit=limit,
+                    filter=list(FIELDS[kind]),
                 )
+            )
+            for item in page:
+                items.setdefault(item.get("id"), item)
+            if len(page) < limit:
+                break
 
-            except Exception as e:
-                print(f"Error collecting from r/{subreddit}: {e}")
-                continue
+            # Truncated: the older part of the window is still unfetched
+            oldest = min(int(item.get("created_utc", 0)) for item in page)
+            if oldest + 1 >= until or oldest < start_time:
+                break
+            until = oldest + 1
 
-        print(f"Total collected: {len(all_data)} items")
-        return all_data
+        return [
+            RedditItem.from_dict(item)
+            for item in self.watermarks.filter_new(source, list(items.values()))
+        ]
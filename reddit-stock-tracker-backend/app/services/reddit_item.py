@@ -0,0 +1,64 @@
+from typing import Dict, Optional
+
+# Subreddits both collectors read unless told otherwise
+DEFAULT_SUBREDDITS = ["wallstreetbets", "stocks", "investing", "SecurityAnalysis"]
+
+# Fields requested from Pushshift per kind; everything else is dropped
+FIELDS = {
+    "submission": ("id", "subreddit", "created_utc", "title", "selftext"),
+    "comment": ("id", "subreddit", "created_utc", "body"),
+}
+
+
+class RedditItem:
+    """A submission or comment projected onto the fields the pipeline reads.
+
+    A slotted record is a fraction of the size of the full Reddit JSON
+    dict, which matters when a refresh or backfill holds many thousands.
+    """
+
+    __slots__ = ("id", "subreddit", "created_utc", "title", "selftext", "body")
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        subreddit: Optional[str] = None,
+        created_utc: int = 0,
+        title: Optional[str] = None,
+        selftext: Optional[str] = None,
+        body: Optional[str] = None,
+    ):
+        self.id = id
+        self.subreddit = subreddit
+        self.created_utc = created_utc
+        self.title = title
+        self.selftext = selftext
+        self.body = body
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RedditItem":
+        return cls(
+            data.get("id"),
+            data.get("subreddit"),
+            int(float(data.get("created_utc") or 0)),
+            data.get("title"),
+            data.get("selftext"),
+            data.get("body"),
+        )
+
+    @property
+    def key(self) -> Optional[str]:
+        """Reddit fullname-style key; submission and comment ids can collide"""
+        if self.id is None:
+            return None
+        prefix = "t3_" if self.title is not None else "t1_"
+        return f"{prefix}{self.id}"
+
+    def text(self) -> str:
+        """Title, selftext and body joined, skipping any that are missing"""
+        return " ".join(
+            part for part in (self.title, self.selftext, self.body) if part
+        )
+
+    def __repr__(self) -> str:
+        return f"RedditItem({self.key!r}, r/{self.subreddit}, {self.created_utc})"
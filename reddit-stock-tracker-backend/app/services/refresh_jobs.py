@@ -0,0 +1,102 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class RefreshJob:
+    """Progress and outcome of one background collect-and-process run"""
+
+    def __init__(self, kind: str = "refresh"):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"  # queued | running | succeeded | skipped | failed
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.items_fetched = 0
+        self.items_processed = 0
+        self.mentions_counted = 0
+        self.error: Optional[str] = None
+        self._done = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job has finished; False if timeout passed first"""
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "items_fetched": self.items_fetched,
+            "items_processed": self.items_processed,
+            "mentions_counted": self.mentions_counted,
+            "error": self.error,
+        }
+
+
+class RefreshJobManager:
+    """Runs refresh jobs one at a time on a worker thread.
+
+    Submitting while a job is queued or running returns that job instead
+    of starting another, so concurrent refresh requests coalesce onto a
+    single collection. The most recent ``max_history`` jobs stay queryable.
+    """
+
+    def __init__(self, max_history: int = 20):
+        self.max_history = max_history
+        self._jobs: "OrderedDict[str, RefreshJob]" = OrderedDict()
+        self._current: Optional[RefreshJob] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh")
+        self._lock = threading.Lock()
+
+    def submit(
+        self, run: Callable[[RefreshJob], None], kind: str = "refresh"
+    ) -> Tuple[RefreshJob, bool]:
+        """Start run(job) in the background; returns (job, created)"""
+        with self._lock:
+            if self._current is not None and self._current.active:
+                return self._current, False
+
+            job = RefreshJob(kind)
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_history:
+                self._jobs.popitem(last=False)
+            self._current = job
+            self._executor.submit(self._run, run, job)
+            return job, True
+
+    def get(self, job_id: str) -> Optional[RefreshJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run(run: Callable[[RefreshJob], None], job: RefreshJob):
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            run(job)
+            if job.status == "running":
+                job.status = "succeeded"
+        except Exception as e:
+            print(f"Refresh job {job.id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            job._done.set()
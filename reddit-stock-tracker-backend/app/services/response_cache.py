@@ -0,0 +1,53 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """Bounded LRU of serialized responses for one data version at a time.
+
+    Entries are (etag, body) pairs. Looking up a version other than the
+    one the cache holds drops every entry, so a data change invalidates
+    all memoized responses without any explicit hook in the ingest path.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.version: Optional[Hashable] = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version: Hashable, key: Hashable) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, version: Hashable, key: Hashable, etag: str, body: bytes):
+        with self._lock:
+            if version != self.version:
+                return  # built from data that has since changed
+
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
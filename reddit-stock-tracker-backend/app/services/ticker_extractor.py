@@ -1,12 +1,49 @@
 import re
-import requests
-from typing import Set
+from typing import Dict, Iterable, Optional, Set
 import os
 
+from . import metrics
+from .finnhub_client import FinnhubClient
+from .ticker_matcher import TickerMatcher
+from .ticker_universe import TickerUniverse, get_ticker_universe
+from .validation_cache import ValidationCache
+
+VALIDATION_SECONDS = metrics.histogram(
+    "ticker_validation_seconds", "Time to validate one batch of candidate tickers"
+)
+VALIDATIONS = metrics.counter(
+    "ticker_validations_total",
+    "Tickers validated, by where the answer came from",
+    ("source",),
+)
+VALIDATED_BY = {
+    source: VALIDATIONS.labels(source)
+    for source in ("universe", "cache", "finnhub", "fallback")
+}
+
 
 class TickerExtractor:
-    def __init__(self):
+    ENGINES = ("regex", "automaton")
+
+    def __init__(self, engine: Optional[str] = None):
         self.finnhub_api_key = os.getenv("FINNHUB_API_KEY", "demo")
+        self.finnhub_client = FinnhubClient(
+            self.finnhub_api_key,
+            base_url=os.getenv("FINNHUB_BASE_URL", "https://finnhub.io/api/v1"),
+            max_workers=int(os.getenv("FINNHUB_MAX_WORKERS", "8")),
+            requests_per_minute=int(os.getenv("FINNHUB_REQUESTS_PER_MINUTE", "60")),
+        )
+        self.validation_cache = ValidationCache(
+            max_entries=int(os.getenv("VALIDATION_CACHE_SIZE", "10000")),
+            positive_ttl=float(os.getenv("VALIDATION_CACHE_TTL", str(7 * 24 * 3600))),
+            negative_ttl=float(
+                os.getenv("VALIDATION_CACHE_NEGATIVE_TTL", str(24 * 3600))
+            ),
+            path=os.getenv("VALIDATION_CACHE_PATH") or None,
+        )
+        self.engine = engine or os.getenv("TICKER_ENGINE", "regex")
+        if self.engine not in self.ENGINES:
+            raise ValueError(f"Unknown ticker engine: {self.engine}")
         self.ticker_pattern = re.compile(r"\$([A-Z]{1,5})\b|\b([A-Z]{2,5})\b")
         self.common_words = {
             "THE",
@@ -251,6 +288,7 @@ class TickerExtractor:
             "YEARS",
             "YOUNG",
         }
+        self._matcher = None  # (universe, TickerMatcher) it was compiled from
 
     def extract_tickers(self, text: str) -> Set[str]:
         """Extract potential stock tickers from text"""
@@ -267,46 +305,81 @@ class TickerExtractor:
 
         return tickers
 
+    def extract_candidates(
+        self, text: str, universe: Optional[TickerUniverse] = None
+    ) -> Set[str]:
+        """Extract tickers that still need validation.
+
+        The automaton engine only ever yields tickers from the known universe,
+        the current one unless another is given.
+        """
+        if self.engine == "automaton":
+            return self._get_matcher(universe or get_ticker_universe()).match(text)
+
+        return self.extract_tickers(text)
+
+    def extract_valid_tickers(self, text: str) -> Set[str]:
+        """Extract tickers from text, keeping only the ones that validate"""
+        candidates = self.extract_candidates(text)
+        if self.engine == "automaton" and self.finnhub_api_key == "demo":
+            return candidates
+
+        validity = self.validate_many(candidates)
+        return {ticker for ticker in candidates if validity[ticker.upper()]}
+
     def validate_ticker(self, ticker: str) -> bool:
         """Validate ticker using Finnhub API"""
-        common_tickers = {
-            "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "NVDA", "TSLA", "META", "BRK.B", "BRK.A",
-            "V", "JPM", "JNJ", "WMT", "PG", "UNH", "HD", "MA", "BAC", "XOM",
-            "ORCL", "CVX", "LLY", "ABBV", "KO", "AVGO", "PEP", "COST", "TMO", "MRK",
-            "ACN", "CSCO", "ABT", "DHR", "TXN", "VZ", "ADBE", "NKE", "CRM", "WFC",
-            "NFLX", "DIS", "INTC", "AMD", "CMCSA", "PFE", "PM", "RTX", "NEE", "UPS",
-            "T", "LOW", "QCOM", "HON", "UNP", "MS", "CAT", "GS", "IBM", "AMGN",
-            "BLK", "AXP", "DE", "SPGI", "BKNG", "MDT", "ADP", "GILD", "LRCX", "TJX",
-            "VRTX", "SYK", "SCHW", "C", "ZTS", "MMC", "CB", "MO", "USB", "PYPL",
-            "SO", "PNC", "AON", "DUK", "CSX", "TMUS", "FCX", "BMY", "NOW", "AMAT",
-            "SHW", "MU", "ICE", "GE", "CME", "TGT", "REGN", "APD", "EOG", "NSC",
-            "KLAC", "SLB", "MDLZ", "ADI", "ISRG", "CI", "CMG", "FISV", "TFC", "MCD",
-            "CVS", "EMR", "BSX", "ITW", "WM", "GD", "MCO", "FDX", "NOC", "EQIX",
-            "APH", "ECL", "PSA", "CL", "WELL", "PLD", "EL", "MCHP", "HUM", "CTAS",
-            "FAST", "PAYX", "ROST", "ODFL", "VRSK", "EXC", "KMB", "CTSH", "GWW", "IDXX",
-            "YUM", "BIIB", "KHC", "DXCM", "EA", "SBUX", "MNST", "EW", "ILMN", "WBA",
-            "CSGP", "ANSS", "ZBH", "CPRT", "MKTX", "WLTW", "CDNS", "SNPS", "MAR", "ROP",
-            "FTNT", "ADSK", "A", "MSCI", "EXR", "PCAR", "CMI", "NXPI", "ORLY", "AZO",
-            "DLTR", "EBAY", "CHTR", "XLNX", "ALGN", "MXIM", "SWKS", "INCY", "SIRI", "WDC",
-            "NTAP", "VIAC", "DISH", "FOXA", "FOX", "GME", "AMC", "PLTR", "BB", "NOK",
-            "COIN", "HOOD", "RBLX", "SNOW", "MSTR", "RIOT", "MARA", "TSM", "ASML", "NVO",
-            "SHOP", "SQ", "ROKU", "PINS", "SNAP", "TWTR", "UBER", "LYFT", "ABNB", "DASH",
-            "ZM", "PTON", "DOCU", "CRWD", "OKTA", "DDOG", "NET", "TWLO", "SPLK", "WDAY",
-            "VEEV", "ZS", "PANW", "TEAM", "MDB", "ESTC", "FSLY", "FVRR", "UPWK", "ETSY",
-            "SPOT", "BABA", "JD", "PDD", "NIO", "XPEV", "LI"
-        }
-
         ticker = ticker.upper()
 
         if self.finnhub_api_key == "demo":
-            return ticker in common_tickers
+            return ticker in get_ticker_universe().symbols
+
+        return self.validate_many([ticker])[ticker]
+
+    def validate_many(self, tickers: Iterable[str]) -> Dict[str, bool]:
+        """Validate a batch of distinct tickers with one bulk Finnhub pass.
+
+        Cached answers are served first; the remaining tickers are looked up
+        concurrently, and lookups that fail fall back to the known universe.
+        """
+        with VALIDATION_SECONDS.time():
+            return self._validate_many(tickers)
+
+    def _validate_many(self, tickers: Iterable[str]) -> Dict[str, bool]:
+        tickers = {ticker.upper() for ticker in tickers}
+        known_tickers = get_ticker_universe().symbols
+
+        if self.finnhub_api_key == "demo":
+            VALIDATED_BY["universe"].inc(len(tickers))
+            return {ticker: ticker in known_tickers for ticker in tickers}
+
+        results = {}
+        misses = []
+        for ticker in tickers:
+            cached = self.validation_cache.get(ticker)
+            if cached is None:
+                misses.append(ticker)
+            else:
+                results[ticker] = cached
+        VALIDATED_BY["cache"].inc(len(results))
+
+        fallbacks = 0
+        for ticker, is_valid in self.finnhub_client.validate_many(misses).items():
+            if is_valid is None:
+                results[ticker] = ticker in known_tickers
+                fallbacks += 1
+            else:
+                self.validation_cache.set(ticker, is_valid)
+                results[ticker] = is_valid
+        VALIDATED_BY["finnhub"].inc(len(misses) - fallbacks)
+        VALIDATED_BY["fallback"].inc(fallbacks)
+
+        return results
 
-        try:
-            url = (f"https://finnhub.io/api/v1/quote?symbol={ticker}"
-                   f"&token={self.finnhub_api_key}")
-            response = requests.get(url, timeout=5)
-            data = response.json()
-            return "c" in data and data["c"] is not None and data["c"] > 0
-        except Exception as e:
-            print(f"Error validating ticker {ticker}: {e}")
-            return ticker in common_tickers
+    def _get_matcher(self, universe: TickerUniverse) -> TickerMatcher:
+        """Return a matcher for universe, recompiling after a hot reload"""
+        compiled = self._matcher
+        if compiled is None or compiled[0] is not universe:
+            compiled = (universe, TickerMatcher(universe, self.common_words))
+            self._matcher = compiled
+        return compiled[1]
@@ -0,0 +1,75 @@
+import re
+from typing import Dict, Iterable, Set
+
+
+class TickerMatcher:
+    """Fused extraction + validation against a known ticker universe.
+
+    The universe is compiled into a character trie, and the trie is
+    serialized into a single regular expression so the scan itself runs
+    inside the C regex engine. The raw text is scanned once without being
+    copied or uppercased, and only known tickers can ever match, so no
+    separate validation pass is needed.
+
+    Matching rules:
+        * cashtags (``$AAPL``, ``$tsla``, ``$V``) match in any case
+        * bare symbols (``AAPL``, ``BRK.B``) must be written in uppercase,
+          be at least two characters long and sit on word boundaries
+        * symbols listed in ``excluded_words`` never match
+    """
+
+    def __init__(self, tickers: Iterable[str], excluded_words: Iterable[str] = ()):
+        excluded = {word.upper() for word in excluded_words}
+        universe = {ticker.upper() for ticker in tickers} - excluded
+        bare = {ticker for ticker in universe if len(ticker) >= 2}
+
+        self.tickers = frozenset(universe)
+        # The leading lookahead gives the regex engine a literal charset to
+        # skip ahead with, so lowercase noise is never fed to the trie.
+        self._pattern = re.compile(
+            r"(?=[$A-Z])(?:\$((?i:"
+            + self._trie_pattern(universe)
+            + r"))\b|\b("
+            + self._trie_pattern(bare)
+            + r")\b)"
+        )
+
+    def match(self, text: str) -> Set[str]:
+        """Return the known tickers mentioned in text"""
+        if not text:
+            return set()
+
+        return {
+            cashtag.upper() or symbol
+            for cashtag, symbol in self._pattern.findall(text)
+        }
+
+    @classmethod
+    def _trie_pattern(cls, words: Set[str]) -> str:
+        """Build a regex alternation shaped like the trie of words"""
+        if not words:
+            return "(?!)"
+
+        trie: Dict = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return cls._node_pattern(trie)
+
+    @classmethod
+    def _node_pattern(cls, node: Dict) -> str:
+        branches = [
+            re.escape(char) + cls._node_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+
+        terminal = "" in node
+        body = "|".join(branches)
+        if len(branches) > 1 or (terminal and not re.fullmatch(r"\\?.", body)):
+            body = "(?:" + body + ")"
+        return body + "?" if terminal else body
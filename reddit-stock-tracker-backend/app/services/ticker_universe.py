@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Iterable, Iterator, Optional
+
+DEFAULT_UNIVERSE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "top_200_stocks.json"
+)
+
+
+class TickerUniverse:
+    """Immutable, ranked set of known ticker symbols.
+
+    Loaded from the JSON written by ``research_top_200_stocks.save_ticker_data``
+    (a list of ``{"ticker", "company", "source"}`` records), or from an
+    envelope of the form ``{"version": ..., "tickers": [...]}``. When the
+    artifact carries no explicit version, the content hash is used instead.
+    """
+
+    def __init__(self, tickers: Iterable[str], version: str):
+        ranked = []
+        seen = set()
+        for ticker in tickers:
+            ticker = ticker.upper()
+            if ticker not in seen:
+                seen.add(ticker)
+                ranked.append(ticker)
+
+        self.tickers = tuple(ranked)
+        self.symbols = frozenset(ranked)
+        self.version = version
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_UNIVERSE_PATH) -> "TickerUniverse":
+        """Load a universe from a ticker JSON artifact"""
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        data = json.loads(raw)
+        version = None
+        if isinstance(data, dict):
+            version = data.get("version")
+            data = data["tickers"]
+        if version is None:
+            version = hashlib.sha256(raw).hexdigest()[:12]
+
+        tickers = [
+            entry if isinstance(entry, str) else entry["ticker"] for entry in data
+        ]
+        return cls(tickers, str(version))
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self.symbols
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tickers)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+
+_current_universe: Optional[TickerUniverse] = None
+_universe_lock = threading.Lock()
+
+
+def get_ticker_universe() -> TickerUniverse:
+    """Return the shared ticker universe, loading it on first use"""
+    global _current_universe
+    universe = _current_universe
+    if universe is None:
+        with _universe_lock:
+            if _current_universe is None:
+                path = os.getenv("TICKER_UNIVERSE_PATH", DEFAULT_UNIVERSE_PATH)
+                _current_universe = TickerUniverse.load(path)
+            universe = _current_universe
+    return universe
+
+
+def reload_ticker_universe(path: Optional[str] = None) -> TickerUniverse:
+    """Atomically swap in a freshly loaded universe.
+
+    The new artifact is fully parsed before the swap, so a bad file leaves
+    the current universe in place and readers never see a partial set.
+    """
+    global _current_universe
+    path = path or os.getenv("TICKER_UNIVERSE_PATH", DEFAULT_UNIVERSE_PATH)
+    universe = TickerUniverse.load(path)
+    with _universe_lock:
+        _current_universe = universe
+    print(f"Loaded ticker universe {universe.version} ({len(universe)} tickers)")
+    return universe
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+class Subscriber:
+    """One connected stream: a bounded queue of encoded events.
+
+    The queue belongs to the event loop serving the client, so events are
+    handed over with call_soon_threadsafe. A client that lets the queue
+    fill up is dropped rather than buffered for.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(max_queue)
+        self.dropped = False
+
+    def offer(self, event: Optional[str]):
+        """Queue an event; must run on the subscriber's loop"""
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.close(dropped=True)
+
+    def close(self, dropped: bool = False):
+        """End the stream, discarding anything still queued"""
+        self.dropped = self.dropped or dropped
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class TrendingBroadcaster:
+    """Pushes trending ranking changes to stream subscribers.
+
+    ``publish`` is called after each ingest batch. It computes the top
+    ``limit`` ranking once, diffs it against the previous one and encodes
+    the delta as a single Server-Sent Events frame shared by every
+    subscriber. New subscribers first receive a full snapshot. Each
+    subscriber has its own bounded queue; one that falls ``max_queue``
+    events behind is disconnected and can reconnect for a fresh snapshot.
+    """
+
+    def __init__(
+        self,
+        ranking: Callable[[int], List[Dict]],
+        limit: int = 10,
+        max_queue: int = 16,
+    ):
+        self.ranking = ranking
+        self.limit = limit
+        self.max_queue = max_queue
+        self.published = 0
+        self.dropped = 0
+        self._subscribers: Set[Subscriber] = set()
+        self._current: Optional[Dict[str, Tuple[int, int]]] = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> Subscriber:
+        """Register a subscriber whose first queued event is a snapshot"""
+        subscriber = Subscriber(loop, self.max_queue)
+        with self._lock:
+            if self._current is None:
+                self._current = self._rank()
+            subscriber.offer(self._frame("snapshot", self._entries(self._current)))
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            if subscriber.dropped:
+                self.dropped += 1
+            if not self._subscribers:
+                self._current = None  # nobody to diff for until next subscribe
+
+    def publish(self):
+        """Broadcast the change in ranking since the last publish, if any"""
+        with self._lock:
+            if not self._subscribers:
+                return
+            current = self._rank()
+            previous = self._current or {}
+            changed = {
+                ticker: entry
+                for ticker, entry in current.items()
+                if previous.get(ticker) != entry
+            }
+            removed = [ticker for ticker in previous if ticker not in current]
+            self._current = current
+            if not changed and not removed:
+                return
+
+            frame = self._frame(
+                "delta", {"changed": self._entries(changed), "removed": removed}
+            )
+            self.published += 1
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, frame)
+            except RuntimeError:  # the subscriber's loop has already closed
+                subscriber.dropped = True
+
+    def close(self):
+        """End every open stream"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.close)
+            except RuntimeError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "dropped": self.dropped,
+            }
+
+    def _rank(self) -> Dict[str, Tuple[int, int]]:
+        """{ticker: (rank, total_mentions)} for the current top tickers"""
+        return {
+            entry["ticker"]: (rank, entry["total_mentions"])
+            for rank, entry in enumerate(self.ranking(self.limit), 1)
+        }
+
+    def _frame(self, event: str, data) -> str:
+        self._version += 1
+        payload = json.dumps(data, separators=(",", ":"))
+        return f"event: {event}\nid: {self._version}\ndata: {payload}\n\n"
+
+    @staticmethod
+    def _entries(ranking: Dict[str, Tuple[int, int]]) -> List[Dict]:
+        return [
+            {"ticker": ticker, "rank": rank, "total_mentions": total}
+            for ticker, (rank, total) in sorted(
+                ranking.items(), key=lambda item: item[1][0]
+            )
+        ]
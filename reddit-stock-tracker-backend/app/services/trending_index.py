@@ -0,0 +1,191 @@
+import bisect
+import heapq
+import threading
+from collections import defaultdict
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+# Named trending windows, in daily buckets. "24h" is the current day's bucket.
+TRENDING_WINDOWS = {"24h": 1, "7d": 7, "30d": 30}
+
+
+class TopK:
+    """The k highest (ticker, total) pairs, kept current as totals change.
+
+    Raising a total is O(k). Lowering one may let an unseen ticker into the
+    top k, so the ranking is marked stale and rebuilt on the next read.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.ranked: List[Tuple[str, int]] = []  # descending by total
+        self.stale = True
+
+    def raise_total(self, ticker: str, total: int):
+        """Record that ticker's total went up to total"""
+        if self.stale:
+            return
+
+        for i, (ranked_ticker, _) in enumerate(self.ranked):
+            if ranked_ticker == ticker:
+                del self.ranked[i]
+                break
+
+        if len(self.ranked) < self.k or total > self.ranked[-1][1]:
+            keys = [-count for _, count in self.ranked]
+            self.ranked.insert(bisect.bisect_right(keys, -total), (ticker, total))
+            del self.ranked[self.k :]
+
+    def invalidate(self):
+        self.stale = True
+
+    def top(self, totals: Dict[str, int], limit: int) -> List[Tuple[str, int]]:
+        """Top limit entries, rebuilding from totals only when stale"""
+        if limit > self.k:
+            return heapq.nlargest(limit, totals.items(), key=itemgetter(1))
+
+        if self.stale:
+            self.ranked = heapq.nlargest(self.k, totals.items(), key=itemgetter(1))
+            self.stale = False
+        return self.ranked[:limit]
+
+
+class TrendingIndex:
+    """Running per-ticker totals and top-K rankings, updated at ingest time.
+
+    All-time totals only ever grow. Each named window keeps its own totals
+    over the last N daily buckets; when the day rolls over, the buckets that
+    fell out of the window are subtracted instead of re-aggregating history.
+    Daily buckets older than the widest window, counted back from the newest
+    date seen, are dropped even if no window has been queried yet.
+    """
+
+    def __init__(self, k: int = 50, windows: Optional[Dict[str, int]] = None):
+        self.windows = dict(TRENDING_WINDOWS if windows is None else windows)
+        self.totals: Dict[str, int] = defaultdict(int)
+        self.top_k = TopK(k)
+        self.window_totals = {name: defaultdict(int) for name in self.windows}
+        self.window_top_k = {name: TopK(k) for name in self.windows}
+        self.window_starts: Dict[str, str] = {}  # {name: first ISO date inside}
+        self.buckets: Dict[str, Dict[str, int]] = {}  # recent {date: {ticker: n}}
+        self.newest: Optional[str] = None  # latest bucket date seen
+        self._lock = threading.Lock()
+
+    @property
+    def retention_days(self) -> int:
+        """How many trailing daily buckets the widest window needs"""
+        return max(self.windows.values(), default=0)
+
+    def load(self, totals: Dict[str, int], buckets: Dict[str, Dict[str, int]]):
+        """Replace all state with totals and recent buckets read from a store"""
+        with self._lock:
+            self.totals = defaultdict(int, totals)
+            self.top_k.invalidate()
+            self.buckets = {
+                date_str: defaultdict(int, ticker_counts)
+                for date_str, ticker_counts in buckets.items()
+            }
+            self.newest = max(self.buckets, default=None)
+            self._prune()
+            self.window_starts.clear()
+            for name in self.windows:
+                self.window_totals[name].clear()
+                self.window_top_k[name].invalidate()
+
+    def add_counts(self, counts: Dict[str, Dict[str, int]]):
+        """Fold a {date: {ticker: count}} ingest batch into the running totals"""
+        with self._lock:
+            newest = max(counts, default=None)
+            if newest is not None and (self.newest is None or newest > self.newest):
+                self.newest = newest
+                self._prune()
+
+            oldest_kept = self._oldest_kept()
+            for date_str, ticker_counts in counts.items():
+                for ticker, count in ticker_counts.items():
+                    self.totals[ticker] += count
+                    self.top_k.raise_total(ticker, self.totals[ticker])
+
+                if oldest_kept is not None and date_str < oldest_kept:
+                    continue
+
+                bucket = self.buckets.setdefault(date_str, defaultdict(int))
+                for ticker, count in ticker_counts.items():
+                    bucket[ticker] += count
+
+                for name, start in self.window_starts.items():
+                    if date_str < start:
+                        continue
+                    totals = self.window_totals[name]
+                    top_k = self.window_top_k[name]
+                    for ticker, count in ticker_counts.items():
+                        totals[ticker] += count
+                        top_k.raise_total(ticker, totals[ticker])
+
+    def top(
+        self,
+        limit: int = 10,
+        window: Optional[str] = None,
+        today: Optional[date] = None,
+    ) -> List[Tuple[str, int]]:
+        """Top tickers overall, or within a named window ending today"""
+        with self._lock:
+            if window is None:
+                return self.top_k.top(self.totals, limit)
+
+            if window not in self.windows:
+                raise KeyError(window)
+
+            self._advance(today or date.today())
+            return self.window_top_k[window].top(self.window_totals[window], limit)
+
+    def _advance(self, today: date):
+        """Slide every window so it ends on today, subtracting expired days"""
+        for name, days in self.windows.items():
+            start = (today - timedelta(days=days - 1)).isoformat()
+            previous = self.window_starts.get(name)
+            if previous == start:
+                continue
+
+            totals = self.window_totals[name]
+            if previous is None or start < previous:
+                totals.clear()
+                for date_str, bucket in self.buckets.items():
+                    if date_str >= start:
+                        for ticker, count in bucket.items():
+                            totals[ticker] += count
+            else:
+                for date_str, bucket in self.buckets.items():
+                    if previous <= date_str < start:
+                        for ticker, count in bucket.items():
+                            totals[ticker] -= count
+                            if not totals[ticker]:
+                                del totals[ticker]
+
+            self.window_starts[name] = start
+            self.window_top_k[name].invalidate()
+
+        self._prune()
+
+    def _prune(self):
+        """Drop daily buckets that no window can need any more"""
+        oldest_kept = self._oldest_kept()
+        if oldest_kept is None:
+            return
+        for date_str in [d for d in self.buckets if d < oldest_kept]:
+            del self.buckets[date_str]
+
+    def _oldest_kept(self) -> Optional[str]:
+        """Earliest bucket date any window can still need.
+
+        Windows end today, or on the newest date seen before any has been
+        queried, so anything older than the widest window from both goes.
+        """
+        starts = list(self.window_starts.values())
+        if self.newest is not None and self.retention_days:
+            newest = date.fromisoformat(self.newest)
+            starts.append(
+                (newest - timedelta(days=self.retention_days - 1)).isoformat()
+            )
+        return min(starts, default=None)
@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ValidationCache:
+    """Bounded LRU cache of ticker validation answers.
+
+    Positive and negative answers expire independently: a ticker that
+    exists rarely stops existing, while a miss might be a new listing, so
+    negatives usually get the shorter TTL. Entries are stamped with wall
+    clock expiry times so a persisted cache stays meaningful across restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        positive_ttl: float = 7 * 24 * 3600,
+        negative_ttl: float = 24 * 3600,
+        path: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # {ticker: (valid, expires_at)}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def get(self, ticker: str) -> Optional[bool]:
+        """Return the cached answer for ticker, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            valid, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[ticker]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(ticker)
+            self.hits += 1
+            return valid
+
+    def set(self, ticker: str, valid: bool):
+        """Cache a validation answer with the TTL for its polarity"""
+        ttl = self.positive_ttl if valid else self.negative_ttl
+        with self._lock:
+            self._entries[ticker] = (valid, time.time() + ttl)
+            self._entries.move_to_end(ticker)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters plus the current size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def save(self):
+        """Persist unexpired entries to disk, if a path was configured"""
+        if not self.path:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = [
+                [ticker, valid, expires_at]
+                for ticker, (valid, expires_at) in self._entries.items()
+                if expires_at > now
+            ]
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
+
+    def load(self):
+        """Warm the cache from disk, dropping anything already expired"""
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading validation cache from {self.path}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            for ticker, valid, expires_at in entries[-self.max_entries :]:
+                if expires_at > now:
+                    self._entries[ticker] = (bool(valid), expires_at)
+        print(f"Loaded {len(self._entries)} cached ticker validations")
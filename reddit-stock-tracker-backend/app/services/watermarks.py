@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+
+class WatermarkStore:
+    """Per-source high-water marks for incremental collection.
+
+    Each source (e.g. ``wallstreetbets/comment``) remembers the newest
+    ``created_utc`` and id it has seen. The next fetch starts ``overlap``
+    seconds before that mark to catch items the archive indexed late, and
+    the ids seen inside the overlap are kept so those items are not counted
+    twice.
+
+    Marks advanced by a fetch are only staged. ``commit`` applies them once
+    the fetched items have been stored, and ``discard`` drops them if the
+    refresh failed, so a failed refresh is fetched again rather than lost.
+    """
+
+    def __init__(self, path: Optional[str] = None, overlap: int = 300):
+        self.path = path
+        self.overlap = overlap
+        # {source: {"created_utc": int, "id": str, "recent": {id: created_utc}}}
+        self._marks: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict] = {}  # staged by filter_new
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._marks)
+
+    def start_time(self, source: str, default: int) -> int:
+        """Where the next fetch for source should begin, never before default"""
+        with self._lock:
+            mark = self._marks.get(source)
+            if mark is None:
+                return default
+            return max(default, mark["created_utc"] - self.overlap)
+
+    def filter_new(self, source: str, items: List[Dict]) -> List[Dict]:
+        """Drop items already seen for source and stage its next watermark"""
+        with self._lock:
+            mark = self._pending.get(source) or self._marks.get(source)
+            recent = dict(mark["recent"]) if mark else {}
+            new_items = [item for item in items if item.get("id") not in recent]
+
+            for item in new_items:
+                if item.get("id") is not None:
+                    recent[item["id"]] = int(item.get("created_utc", 0))
+            if not recent:
+                return new_items
+
+            newest_id = max(recent, key=recent.get)
+            newest = recent[newest_id]
+            self._pending[source] = {
+                "created_utc": newest,
+                "id": newest_id,
+                "recent": {
+                    item_id: created_utc
+                    for item_id, created_utc in recent.items()
+                    if created_utc >= newest - self.overlap
+                },
+            }
+            return new_items
+
+    def commit(self):
+        """Apply the staged marks, once their items have been stored"""
+        with self._lock:
+            self._marks.update(self._pending)
+            self._pending.clear()
+
+    def discard(self):
+        """Drop the staged marks, so their items are fetched again"""
+        with self._lock:
+            self._pending.clear()
+
+    def save(self):
+        """Persist committed watermarks to disk, if a path was configured"""
+        if not self.path:
+            return
+
+        with self._lock:
+            marks = json.dumps(self._marks)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(marks)
+        os.replace(tmp_path, self.path)
+
+    def load(self):
+        """Restore watermarks saved by a previous run"""
+        try:
+            with open(self.path) as f:
+                marks = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading watermarks from {self.path}: {e}")
+            return
+
+        with self._lock:
+            self._marks = marks
+            self._pending.clear()
+        print(f"Loaded watermarks for {len(marks)} sources")
+
+
+def default_watermark_path() -> Optional[str]:
+    """WATERMARK_PATH, else a file next to a durable SQLite mention store"""
+    path = os.getenv("WATERMARK_PATH")
+    if path is None and os.getenv("MENTION_STORE", "dict") == "sqlite":
+        path = (os.getenv("MENTION_DB_PATH") or "mentions.db") + ".watermarks.json"
+    return path
@@ -0,0 +1,51 @@
+import os
+import sys
+
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import create_mention_store
+
+from .test_dump_collector import write_dump, write_truncated_gzip
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+import backfill_from_dumps  # noqa: E402
+
+
+class StaticExtractor:
+    """Finds GME in every item and accepts it without any lookups"""
+
+    def extract_candidates(self, text, universe=None):
+        return ["GME"]
+
+    def validate_many(self, tickers):
+        return {ticker: True for ticker in tickers}
+
+
+def make_processor(tmp_path):
+    return DataProcessor(create_mention_store("sqlite", str(tmp_path / "m.db")))
+
+
+def test_rerun_skips_files_already_backfilled(tmp_path):
+    dump = tmp_path / "RC_ok.ndjson"
+    write_dump(dump, [
+        {"id": "a", "subreddit": "stocks", "created_utc": 1700000000, "body": "x"},
+    ])
+    processor = make_processor(tmp_path)
+    paths = [str(dump)]
+
+    assert backfill_from_dumps.backfill(processor, StaticExtractor(), paths) == 1
+    assert backfill_from_dumps.backfill(processor, StaticExtractor(), paths) == 0
+    assert processor.store.ticker_totals() == {"GME": 1}
+    processor.close()
+
+
+def test_truncated_file_is_not_recorded_as_backfilled(tmp_path):
+    dump = tmp_path / "RC_cut.ndjson.gz"
+    write_truncated_gzip(dump, 2000)
+    processor = make_processor(tmp_path)
+    paths = [str(dump)]
+
+    first = backfill_from_dumps.backfill(processor, StaticExtractor(), paths)
+    assert 0 < first < 2000
+    assert processor.store.get_meta(f"backfill:{dump}") is None
+    assert backfill_from_dumps.backfill(processor, StaticExtractor(), paths) == first
+    processor.close()
@@ -0,0 +1,77 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import create_mention_store
+from app.services.ticker_universe import get_ticker_universe
+
+COUNTS = {
+    "2024-01-01": {"GME": 3, "AMC": 1},
+    "2024-01-02": {"GME": 2, "TSLA": 7},
+    "2024-01-08": {"AMC": 4},
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("FINNHUB_API_KEY", "demo")  # validate against the universe
+    processor = DataProcessor(create_mention_store("dict"))
+    processor._add_counts(COUNTS)
+    monkeypatch.setattr(main, "_services", {"data_processor": processor})
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("endpoint", ["/api/tickers/history", "/api/tickers/validate"])
+def test_batch_size_bounds(client, endpoint):
+    assert client.post(endpoint, json={"tickers": []}).status_code == 400
+
+    watchlist = list(get_ticker_universe().tickers)[:200]
+    assert client.post(endpoint, json={"tickers": watchlist}).status_code == 200
+
+    too_many = [f"Z{i:04d}" for i in range(main.max_batch_tickers + 1)]
+    assert client.post(endpoint, json={"tickers": too_many}).status_code == 400
+
+
+def test_batch_history_matches_per_ticker_history(client):
+    body = {"tickers": ["gme", "AMC", "GME", "ZZZZQ"], "start": "2024-01-02"}
+    batch = client.post("/api/tickers/history", json=body).json()
+
+    assert list(batch["tickers"]) == ["GME", "AMC", "ZZZZQ"]
+    assert batch["tickers"]["ZZZZQ"] == [0] * len(batch["dates"])
+    for ticker in ("GME", "AMC"):
+        single = client.get(
+            f"/api/ticker/{ticker}/history", params={"start": "2024-01-02"}
+        ).json()["history"]
+        assert [point["date"] for point in single] == batch["dates"]
+        assert [point["mentions"] for point in single] == batch["tickers"][ticker]
+
+
+def test_batch_history_rolls_up_by_week(client):
+    body = {"tickers": ["GME", "AMC"], "granularity": "week"}
+    batch = client.post("/api/tickers/history", json=body).json()
+    single = client.get(
+        "/api/ticker/AMC/history", params={"granularity": "week"}
+    ).json()["history"]
+
+    assert [point["mentions"] for point in single] == batch["tickers"]["AMC"]
+    assert sum(batch["tickers"]["GME"]) == 5
+
+    body["granularity"] = "hour"
+    assert client.post("/api/tickers/history", json=body).status_code == 400
+
+
+def test_batch_validate_matches_per_ticker_validate(client):
+    tickers = ["gme", "TSLA", "ZZZZQ"]
+    results = client.post(
+        "/api/tickers/validate", json={"tickers": tickers, "end": "2024-01-01"}
+    ).json()["results"]
+
+    assert [r["ticker"] for r in results] == ["GME", "TSLA", "ZZZZQ"]
+    assert [r["mentions"] for r in results] == [3, 0, 0]
+    for result in results:
+        single = client.post(
+            "/api/ticker/validate", json={"ticker": result["ticker"]}
+        ).json()
+        assert single["valid"] == result["valid"]
+    assert [r["valid"] for r in results] == [True, True, False]
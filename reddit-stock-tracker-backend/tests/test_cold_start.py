@@ -0,0 +1,108 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.services.watermarks import WatermarkStore
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous enough for a loaded CI box, far below a blocking 30-day collection
+FIRST_REQUEST_BUDGET = 10.0
+
+CHILD_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+import app.main
+
+with TestClient(app.main.app) as client:
+    client.get("/healthz").raise_for_status()
+    first_request = time.perf_counter() - start
+
+print(json.dumps({
+    "first_request": first_request,
+    "pmaw_imported": "pmaw" in sys.modules,
+}))
+"""
+
+
+class BlockingCollector:
+    """A collector whose refresh does not finish until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.watermarks = WatermarkStore()
+        self.sources_attempted = 0
+        self.failed_sources = []
+
+    def iter_recent_data(self, days_back: int = 30):
+        self.release.wait(10)
+        return iter([])
+
+
+@pytest.fixture
+def fresh_app(monkeypatch):
+    monkeypatch.setenv("STARTUP_COLLECTION", "1")
+    monkeypatch.setenv("INGEST_INTERVAL", "0")
+    monkeypatch.setenv("MOCK_DATA", "0")
+    monkeypatch.setenv("MENTION_STORE", "dict")
+    monkeypatch.setenv("FINNHUB_API_KEY", "demo")
+    monkeypatch.setattr(main, "_services", {})
+    monkeypatch.setattr(main, "initial_job_id", None)
+    monkeypatch.setattr(main, "ingest_scheduler", None)
+    return main
+
+
+def test_time_to_first_request(tmp_path):
+    env = dict(
+        os.environ,
+        STARTUP_COLLECTION="1",
+        INGEST_INTERVAL="0",
+        FINNHUB_API_KEY="demo",
+        REDDIT_DUMP_PATHS=str(tmp_path / "missing-*.ndjson"),
+        PYTHONWARNINGS="ignore",
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The background collection may log after the child's result line
+    line = next(line for line in result.stdout.splitlines() if line.startswith("{"))
+    sample = json.loads(line)
+
+    print(f"time to first request: {sample['first_request'] * 1000:.0f} ms")
+    assert sample["first_request"] < FIRST_REQUEST_BUDGET
+    assert not sample["pmaw_imported"]
+
+
+def test_startup_does_not_wait_for_initial_collection(fresh_app, monkeypatch):
+    collector = BlockingCollector()
+    monkeypatch.setattr(fresh_app, "_build_reddit_collector", lambda: collector)
+
+    with TestClient(fresh_app.app) as client:
+        start = time.perf_counter()
+        assert client.get("/healthz").status_code == 200
+        assert time.perf_counter() - start < 1
+
+        ready = client.get("/readyz")
+        assert ready.status_code == 503
+        assert ready.json()["initial_collection"]["status"] in ("queued", "running")
+
+        collector.release.set()
+        job = fresh_app.get_refresh_jobs().get(fresh_app.initial_job_id)
+        assert job.wait(5)
+        assert job.status == "succeeded"
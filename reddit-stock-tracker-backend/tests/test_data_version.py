@@ -0,0 +1,65 @@
+from fastapi.testclient import TestClient
+
+from app import main
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import create_mention_store
+
+
+def open_processor(path):
+    return DataProcessor(create_mention_store("sqlite", str(path)))
+
+
+def test_workers_sharing_a_store_agree_on_the_version(tmp_path):
+    path = tmp_path / "mentions.db"
+    writer = open_processor(path)
+    reader = open_processor(path)
+    assert writer.version == reader.version
+
+    writer._add_counts({"2024-01-02": {"GME": 3}})
+    assert writer.version != reader.version
+    assert reader.sync_from_store(0)
+    assert writer.version == reader.version
+
+    writer.close()
+    reader.close()
+
+
+def test_reopened_store_keeps_its_version(tmp_path):
+    path = tmp_path / "mentions.db"
+    processor = open_processor(path)
+    processor._add_counts({"2024-01-02": {"GME": 3}})
+    version = processor.version
+    processor.close()
+
+    reopened = open_processor(path)
+    assert reopened.version == version
+    reopened.close()
+
+
+def test_in_memory_versions_are_per_instance():
+    first = DataProcessor(create_mention_store("dict"))
+    second = DataProcessor(create_mention_store("dict"))
+    assert first.version != second.version
+
+
+def test_if_none_match_compares_whole_tags():
+    etag = 'W/"3.7.abcdef012345"'
+    assert main._etag_matches(etag, etag)
+    assert main._etag_matches('"3.7.abcdef012345"', etag)
+    assert main._etag_matches('W/"1.2.000000000000" , W/"3.7.abcdef012345"', etag)
+    assert main._etag_matches("*", etag)
+    assert not main._etag_matches("", etag)
+    assert not main._etag_matches('W/"3.7.abcdef01234"', etag)
+
+
+def test_trending_answers_304_only_for_its_current_etag(monkeypatch):
+    processor = DataProcessor(create_mention_store("dict"))
+    processor._add_counts({"2024-01-02": {"GME": 3}})
+    monkeypatch.setattr(main, "_services", {"data_processor": processor})
+    client = TestClient(main.app)
+
+    etag = client.get("/api/trending").headers["etag"]
+    headers = {"If-None-Match": f'"other", {etag}'}
+    assert client.get("/api/trending", headers=headers).status_code == 304
+    headers = {"If-None-Match": etag[:-2] + '"'}
+    assert client.get("/api/trending", headers=headers).status_code == 200
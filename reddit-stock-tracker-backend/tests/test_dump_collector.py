@@ -0,0 +1,64 @@
+import gzip
+import json
+
+import pytest
+
+from app.services.dump_collector import DumpCollector
+
+
+def write_dump(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def test_only_items_from_wanted_subreddits(tmp_path):
+    dump = tmp_path / "RC_test.ndjson"
+    write_dump(dump, [
+        {"id": "a", "subreddit": "WallStreetBets", "created_utc": 10, "body": "GME"},
+        {
+            "id": "b",
+            "subreddit": "pics",
+            "created_utc": 20,
+            "title": "crosspost",
+            "crosspost_parent_list": [{"subreddit": "wallstreetbets"}],
+        },
+        {"id": "c", "subreddit": "pics", "created_utc": 30, "body": "AMC"},
+    ])
+
+    items = list(DumpCollector([str(dump)]).iter_items())
+    assert [item.id for item in items] == ["a"]
+
+
+def write_truncated_gzip(path, count):
+    """A gzip dump of count items, cut off halfway through the stream"""
+    lines = "".join(
+        json.dumps({
+            "id": format(i, "x"),
+            "subreddit": "stocks",
+            "created_utc": 1700000000 + i,
+            "body": f"GME item {i} " + "padding " * 20,
+        }) + "\n"
+        for i in range(count)
+    )
+    data = gzip.compress(lines.encode(), compresslevel=1)
+    path.write_bytes(data[: len(data) // 2])
+
+
+def test_truncated_dump_is_reported_as_failed(tmp_path):
+    dump = tmp_path / "RC_cut.ndjson.gz"
+    write_truncated_gzip(dump, 2000)
+    collector = DumpCollector([str(dump)])
+
+    items = list(collector.iter_items())
+    assert 0 < len(items) < 2000
+    assert collector.failed_sources == [str(dump)]
+
+
+def test_corrupt_zst_dump_is_reported_as_failed(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    dump = tmp_path / "RC_bad.ndjson.zst"
+    data = zstandard.ZstdCompressor().compress(b'{"subreddit": "stocks"}\n' * 1000)
+    dump.write_bytes(data[:8] + b"\xff" * (len(data) - 8))
+    collector = DumpCollector([str(dump)])
+
+    assert list(collector.iter_items()) == []
+    assert collector.failed_sources == [str(dump)]
@@ -0,0 +1,152 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.services.finnhub_client import FinnhubClient
+from app.services.ticker_extractor import TickerExtractor
+
+
+class FakeQuoteServer:
+    """Local stand-in for Finnhub's /quote endpoint.
+
+    ``prices`` maps symbols to their current price; unknown symbols get a
+    zero quote. ``throttle`` maps symbols to how many 429s they answer with
+    before succeeding, and ``fail`` lists symbols that always 500.
+    """
+
+    def __init__(self, prices, throttle=None, fail=(), retry_after="0"):
+        self.prices = prices
+        self.throttle = dict(throttle or {})
+        self.fail = set(fail)
+        self.retry_after = retry_after
+        self.requests = []
+        self.client_ports = set()
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                symbol = parse_qs(urlparse(self.path).query)["symbol"][0]
+                with server._lock:
+                    server.requests.append(symbol)
+                    server.client_ports.add(self.client_address[1])
+                    throttled = server.throttle.get(symbol, 0)
+                    if throttled:
+                        server.throttle[symbol] = throttled - 1
+
+                if throttled:
+                    self._send(429, {"error": "slow down"}, server.retry_after)
+                elif symbol in server.fail:
+                    self._send(500, {"error": "boom"})
+                else:
+                    self._send(200, {"c": server.prices.get(symbol, 0)})
+
+            def _send(self, status, body, retry_after=None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if retry_after is not None:
+                    self.send_header("Retry-After", retry_after)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_client(server, **kwargs):
+    options = {"requests_per_minute": 6000, "burst": 100, "backoff": 0.01}
+    options.update(kwargs)
+    return FinnhubClient("test-key", base_url=server.base_url, **options)
+
+
+def test_validate_many_answers_each_ticker_once():
+    with FakeQuoteServer({"AAPL": 190.5, "MSFT": 410.0}) as server:
+        client = make_client(server)
+        results = client.validate_many(["AAPL", "MSFT", "NOPE", "AAPL"])
+        client.close()
+
+    assert results == {"AAPL": True, "MSFT": True, "NOPE": False}
+    assert sorted(server.requests) == ["AAPL", "MSFT", "NOPE"]
+
+
+def test_connections_are_pooled():
+    tickers = [f"T{i:03d}" for i in range(60)]
+    with FakeQuoteServer({ticker: 1 for ticker in tickers}) as server:
+        client = make_client(server, max_workers=4)
+        results = client.validate_many(tickers)
+        client.close()
+
+    assert all(results.values())
+    # Keep-alive: at most one connection per worker, not one per request
+    assert len(server.client_ports) <= 4
+
+
+def test_429_is_retried_until_it_succeeds():
+    with FakeQuoteServer({"GME": 25.0}, throttle={"GME": 2}) as server:
+        client = make_client(server)
+        assert client.validate_many(["GME"]) == {"GME": True}
+        client.close()
+
+    assert server.requests == ["GME", "GME", "GME"]
+
+
+def test_exhausted_retries_report_none():
+    with FakeQuoteServer({"GME": 25.0}, throttle={"GME": 10}) as server:
+        client = make_client(server, max_retries=2)
+        assert client.validate_many(["GME"]) == {"GME": None}
+        client.close()
+
+    assert len(server.requests) == 3
+
+
+def test_retry_after_is_capped():
+    throttle = {"GME": 1}
+    with FakeQuoteServer({"GME": 25.0}, throttle, retry_after="3600") as server:
+        client = make_client(server, max_retry_delay=0.05)
+        assert client.validate_many(["GME"]) == {"GME": True}
+        client.close()
+
+
+@pytest.mark.parametrize("header", ["3600", "oops", "-5"])
+def test_retry_delay_bounds(header):
+    client = FinnhubClient("test-key", backoff=100, max_retry_delay=2)
+
+    class Response:
+        headers = {"Retry-After": header}
+
+    assert 0 <= client._retry_delay(Response(), attempt=5) <= 2
+    client.close()
+
+
+def test_failed_lookups_fall_back_to_the_universe(monkeypatch):
+    with FakeQuoteServer({}, fail={"AAPL", "ZZZZ"}) as server:
+        monkeypatch.setenv("FINNHUB_API_KEY", "test-key")
+        monkeypatch.setenv("FINNHUB_BASE_URL", server.base_url)
+        monkeypatch.delenv("VALIDATION_CACHE_PATH", raising=False)
+        extractor = TickerExtractor()
+        results = extractor.validate_many(["AAPL", "ZZZZ"])
+        extractor.finnhub_client.close()
+
+    # AAPL is in the bundled universe, ZZZZ is not; neither gets cached
+    assert results == {"AAPL": True, "ZZZZ": False}
+    assert extractor.validation_cache.stats()["size"] == 0
@@ -0,0 +1,52 @@
+from app.services.data_processor import DataProcessor
+from app.services.item_dedup import ItemDeduplicator
+from app.services.mention_store import create_mention_store
+from app.services.reddit_item import RedditItem
+
+CREATED = 1700000000
+
+
+class FailingExtractor:
+    """Finds GME everywhere, but validating fails like an unreachable API"""
+
+    def extract_candidates(self, text, universe=None):
+        return ["GME"]
+
+    def validate_many(self, tickers):
+        raise RuntimeError("validation unavailable")
+
+
+class StaticExtractor(FailingExtractor):
+    def validate_many(self, tickers):
+        return {ticker: True for ticker in tickers}
+
+
+def make_items():
+    return [
+        RedditItem("a", "wallstreetbets", CREATED, body="GME"),
+        RedditItem("a", "wallstreetbets", CREATED, body="GME"),
+        RedditItem("b", "wallstreetbets", CREATED, body="GME"),
+    ]
+
+
+def test_contains_only_after_record():
+    dedup = ItemDeduplicator()
+    assert not dedup.contains("a", CREATED)
+
+    dedup.record({"a": CREATED}, duplicates=2)
+    assert dedup.contains("a", CREATED)
+    assert dedup.stats()["duplicates"] == 2
+    assert dedup.stats()["recent_size"] == 1
+
+
+def test_failed_batch_does_not_mark_items_seen():
+    processor = DataProcessor(create_mention_store("dict"))
+    try:
+        processor.process_reddit_data(make_items(), FailingExtractor())
+    except RuntimeError:
+        pass
+    assert processor.deduplicator.stats()["recent_size"] == 0
+
+    processor.process_reddit_data(make_items(), StaticExtractor())
+    assert processor.store.ticker_totals() == {"GME": 2}
+    assert processor.deduplicator.stats()["duplicates"] == 1
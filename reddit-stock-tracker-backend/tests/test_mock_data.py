@@ -0,0 +1,53 @@
+from datetime import date
+
+import pytest
+
+from app.services import mock_data
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import create_mention_store
+from app.services.mock_data import MockDataGenerator
+
+END = date(2024, 1, 7)  # a Sunday
+
+
+def as_rows(counts):
+    return counts.tolist() if hasattr(counts, "tolist") else counts
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(mock_data, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("hourly", [False, True])
+def test_generates_daily_buckets(backend, hourly):
+    generator = MockDataGenerator(ticker_count=20, days=7, hourly=hourly, end=END)
+    dates, tickers, counts = generator.generate_matrix()
+    rows = as_rows(counts)
+
+    assert dates == [f"2024-01-0{day}" for day in range(1, 8)]
+    assert len(tickers) == 20
+    assert [len(row) for row in rows] == [20] * 7
+    # Volatility is 0.7-1.3 around the base level, damped on weekends
+    level = MockDataGenerator._base_count(0, tickers[0])
+    assert 0.6 * level <= rows[0][0] <= 1.3 * level
+    assert rows[-1][0] <= 1.3 * mock_data.WEEKEND_FACTOR * level
+
+
+def test_seeded_runs_are_reproducible(backend):
+    first = MockDataGenerator(ticker_count=10, days=3, seed=7, hourly=True, end=END)
+    second = MockDataGenerator(ticker_count=10, days=3, seed=7, hourly=True, end=END)
+    assert as_rows(first.generate_matrix()[2]) == as_rows(second.generate_matrix()[2])
+
+
+def test_seed_hourly_mock_data():
+    processor = DataProcessor(create_mention_store("dict"))
+    processor.seed_mock_data(ticker_count=5, days=3, hourly=True)
+
+    assert len(processor.get_all_dates()) == 3
+    assert len(processor.store.ticker_totals()) == 5
+    assert processor.store.get_meta("mock_data") == "1"
@@ -0,0 +1,61 @@
+import pytest
+
+from app import main
+from app.services.refresh_jobs import RefreshJob
+from app.services.watermarks import WatermarkStore
+
+
+class RecordingCollector:
+    """A collector with no watermarks that records each refresh"""
+
+    def __init__(self):
+        self.watermarks = WatermarkStore()
+        self.sources_attempted = 0
+        self.failed_sources = []
+        self.calls = 0
+
+    def iter_recent_data(self, days_back: int = 30):
+        self.calls += 1
+        return iter([])
+
+
+@pytest.fixture
+def sqlite_app(monkeypatch, tmp_path):
+    monkeypatch.delenv("MOCK_DATA", raising=False)
+    monkeypatch.setenv("MENTION_STORE", "sqlite")
+    monkeypatch.setenv("MENTION_DB_PATH", str(tmp_path / "mentions.db"))
+    monkeypatch.setenv("MOCK_DAYS", "3")
+    monkeypatch.setenv("MOCK_TICKERS", "5")
+    monkeypatch.setenv("FINNHUB_API_KEY", "demo")
+    monkeypatch.setattr(main, "_services", {})
+    monkeypatch.setattr(main, "ingest_lease", None)
+    collector = RecordingCollector()
+    monkeypatch.setattr(main, "_build_reddit_collector", lambda: collector)
+    yield main, collector
+    main.get_data_processor().close()
+
+
+def test_persistent_store_is_not_seeded_by_default(sqlite_app):
+    app_main, _ = sqlite_app
+    assert app_main.get_data_processor().get_all_dates() == []
+
+
+def test_seeded_persistent_store_still_collects(sqlite_app, monkeypatch):
+    app_main, collector = sqlite_app
+    monkeypatch.setenv("MOCK_DATA", "1")
+    assert app_main.get_data_processor().get_all_dates()
+
+    job = RefreshJob("startup")
+    app_main._run_initial_refresh(job)
+    assert job.status != "skipped"
+    assert collector.calls == 1
+
+
+def test_collected_persistent_store_skips_startup(sqlite_app):
+    app_main, collector = sqlite_app
+    app_main.get_data_processor().store.add_counts({"2024-01-02": {"GME": 3}})
+
+    job = RefreshJob("startup")
+    app_main._run_initial_refresh(job)
+    assert job.status == "skipped"
+    assert collector.calls == 0
@@ -0,0 +1,69 @@
+from app.services import reddit_collector
+from app.services.reddit_collector import RedditCollector
+from app.services.watermarks import WatermarkStore
+
+START = 1700000000
+
+
+class FakeArchive:
+    """Stands in for pmaw: the newest limit items in [since, until)"""
+
+    items = []
+    requests = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def search_comments(self, subreddit, since, until, limit, filter):
+        FakeArchive.requests.append((since, until))
+        window = [
+            item for item in self.items if since <= item["created_utc"] < until
+        ]
+        window.sort(key=lambda item: item["created_utc"], reverse=True)
+        return iter(window[:limit])
+
+    search_submissions = search_comments
+
+
+def make_items(count, step=10):
+    return [
+        {"id": format(i, "x"), "subreddit": "stocks",
+         "created_utc": START + i * step, "body": "GME"}
+        for i in range(count)
+    ]
+
+
+def make_collector(monkeypatch, items):
+    monkeypatch.setattr(reddit_collector, "SharedBudgetPushshiftAPI", FakeArchive)
+    monkeypatch.setattr(FakeArchive, "items", items)
+    monkeypatch.setattr(FakeArchive, "requests", [])
+    collector = RedditCollector(watermarks=WatermarkStore())
+    collector.limits = {"submission": 10, "comment": 10}
+    return collector
+
+
+def test_truncated_window_is_paged_back_to_its_start(monkeypatch):
+    items = make_items(35)
+    collector = make_collector(monkeypatch, items)
+    end = START + 35 * 10
+
+    found = collector._search("stocks", "comment", START, end)
+    assert sorted(item.id for item in found) == sorted(i["id"] for i in items)
+    assert len(FakeArchive.requests) == 4
+
+
+def test_items_sharing_a_second_across_pages_are_kept_once(monkeypatch):
+    items = make_items(30)
+    for i, item in enumerate(items):
+        item["created_utc"] = START + i // 2  # two items per second
+    collector = make_collector(monkeypatch, items)
+
+    found = collector._search("stocks", "comment", START, START + 15)
+    assert sorted(item.id for item in found) == sorted(i["id"] for i in items)
+
+
+def test_untruncated_window_is_one_request(monkeypatch):
+    collector = make_collector(monkeypatch, make_items(5))
+
+    assert len(collector._search("stocks", "comment", START, START + 100)) == 5
+    assert len(FakeArchive.requests) == 1
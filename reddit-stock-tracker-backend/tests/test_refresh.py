@@ -0,0 +1,39 @@
+import pytest
+
+from app import main
+from app.services.dump_collector import DumpCollector
+from app.services.refresh_jobs import RefreshJobManager
+
+
+@pytest.fixture
+def dump_app(monkeypatch):
+    monkeypatch.setenv("MOCK_DATA", "0")
+    monkeypatch.setenv("MENTION_STORE", "dict")
+    monkeypatch.setenv("FINNHUB_API_KEY", "demo")
+    monkeypatch.setattr(main, "_services", {})
+    return main
+
+
+def run_refresh(app_main, collector):
+    app_main._services["reddit_collector"] = collector
+    job = RefreshJobManager().submit(app_main._run_refresh)[0]
+    assert job.wait(10)
+    return job
+
+
+def test_refresh_fails_when_every_source_fails(dump_app, tmp_path):
+    collector = DumpCollector([str(tmp_path / "missing.ndjson")])
+    job = run_refresh(dump_app, collector)
+
+    assert job.status == "failed"
+    assert "Every source failed" in job.error
+
+
+def test_refresh_succeeds_when_some_sources_fail(dump_app, tmp_path):
+    dump = tmp_path / "RC_ok.ndjson"
+    dump.write_text('{"id": "a", "subreddit": "stocks", "created_utc": 1}\n')
+    collector = DumpCollector([str(dump), str(tmp_path / "missing.ndjson")])
+    job = run_refresh(dump_app, collector)
+
+    assert collector.failed_sources == [str(tmp_path / "missing.ndjson")]
+    assert job.status == "succeeded"
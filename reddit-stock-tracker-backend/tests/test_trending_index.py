@@ -0,0 +1,68 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.data_processor import DataProcessor
+from app.services.mention_store import create_mention_store
+from app.services.trending_index import TRENDING_WINDOWS, TrendingIndex
+
+TODAY = date.today()
+TICKERS = [f"T{i:03d}" for i in range(120)]
+
+
+def random_batches(days: int, seed: int = 7):
+    """Ingest batches over the last days, several per day and out of order"""
+    rng = random.Random(seed)
+    batches = []
+    for offset in range(days):
+        date_str = (TODAY - timedelta(days=offset)).isoformat()
+        for _ in range(3):
+            tickers = rng.sample(TICKERS, 15)
+            batches.append({date_str: {t: rng.randint(1, 50) for t in tickers}})
+    rng.shuffle(batches)
+    return batches
+
+
+def brute_force(store, window=None):
+    """Totals summed straight from the store's daily counts"""
+    start = None
+    if window is not None:
+        start = (TODAY - timedelta(days=TRENDING_WINDOWS[window] - 1)).isoformat()
+    totals = Counter()
+    for date_str, counts in store.counts_by_date(start).items():
+        totals.update(counts)
+    return totals
+
+
+@pytest.mark.parametrize("window", [None, *TRENDING_WINDOWS])
+@pytest.mark.parametrize("limit", [10, 200])
+def test_windows_match_brute_force_sums(window, limit):
+    processor = DataProcessor(create_mention_store("dict"))
+    batches = random_batches(45)
+    for batch in batches[:60]:
+        processor._add_counts(batch)
+    processor.get_trending_tickers(limit, window)  # windows now maintained
+    for batch in batches[60:]:
+        processor._add_counts(batch)
+
+    expected = brute_force(processor.store, window)
+    trending = processor.get_trending_tickers(limit, window)
+
+    assert all(expected[t["ticker"]] == t["total_mentions"] for t in trending)
+    assert [t["total_mentions"] for t in trending] == sorted(
+        expected.values(), reverse=True
+    )[:limit]
+
+
+def test_buckets_are_pruned_without_windowed_queries():
+    index = TrendingIndex()
+    start = TODAY - timedelta(days=400)
+    for offset in range(400):
+        date_str = (start + timedelta(days=offset)).isoformat()
+        index.add_counts({date_str: {"GME": 1}})
+
+    assert len(index.buckets) == index.retention_days
+    assert index.totals["GME"] == 400
+    assert index.top(window="30d", today=TODAY - timedelta(days=1)) == [("GME", 30)]
@@ -0,0 +1,62 @@
+from app.services import validation_cache
+from app.services.validation_cache import ValidationCache
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def test_positive_and_negative_ttls_expire_separately(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(validation_cache.time, "time", clock.time)
+    cache = ValidationCache(positive_ttl=100, negative_ttl=10)
+    cache.set("AAPL", True)
+    cache.set("ZZZZ", False)
+
+    clock.now += 11
+    assert cache.get("AAPL") is True
+    assert cache.get("ZZZZ") is None
+
+    clock.now += 90
+    assert cache.get("AAPL") is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 0}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ValidationCache(max_entries=2)
+    cache.set("AAPL", True)
+    cache.set("MSFT", True)
+    assert cache.get("AAPL") is True  # MSFT is now least recently used
+    cache.set("GME", True)
+
+    assert cache.get("MSFT") is None
+    assert cache.get("AAPL") is True
+    assert cache.get("GME") is True
+    assert cache.stats()["evictions"] == 1
+
+
+def test_persisted_cache_starts_warm(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(validation_cache.time, "time", clock.time)
+    path = str(tmp_path / "validation.json")
+    cache = ValidationCache(positive_ttl=100, negative_ttl=10, path=path)
+    cache.set("AAPL", True)
+    cache.set("ZZZZ", False)
+    cache.save()
+
+    # The negative answer expires while the process is down
+    clock.now += 50
+    restored = ValidationCache(positive_ttl=100, negative_ttl=10, path=path)
+    assert restored.get("AAPL") is True
+    assert restored.get("ZZZZ") is None
+    assert restored.stats()["size"] == 1
+
+
+def test_unreadable_cache_file_starts_cold(tmp_path):
+    path = tmp_path / "validation.json"
+    path.write_text("not json")
+    assert ValidationCache(path=str(path)).stats()["size"] == 0
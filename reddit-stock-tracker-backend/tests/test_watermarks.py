@@ -0,0 +1,47 @@
+from app.services.watermarks import WatermarkStore, default_watermark_path
+
+SOURCE = "wallstreetbets/comment"
+ITEMS = [{"id": "a", "created_utc": 1000}, {"id": "b", "created_utc": 2000}]
+
+
+def test_marks_apply_only_once_committed(tmp_path):
+    path = str(tmp_path / "marks.json")
+    marks = WatermarkStore(path, overlap=100)
+
+    assert marks.filter_new(SOURCE, ITEMS) == ITEMS
+    assert marks.start_time(SOURCE, 0) == 0
+    marks.save()
+    assert len(WatermarkStore(path)) == 0
+
+    marks.commit()
+    assert marks.start_time(SOURCE, 0) == 1900
+    marks.save()
+    assert WatermarkStore(path, overlap=100).start_time(SOURCE, 0) == 1900
+
+
+def test_discarded_marks_refetch_their_items():
+    marks = WatermarkStore()
+    marks.filter_new(SOURCE, ITEMS)
+    marks.discard()
+
+    assert marks.filter_new(SOURCE, ITEMS) == ITEMS
+
+
+def test_staged_items_are_not_yielded_twice():
+    marks = WatermarkStore()
+    marks.filter_new(SOURCE, ITEMS[:1])
+
+    assert marks.filter_new(SOURCE, ITEMS) == ITEMS[1:]
+
+
+def test_default_path_follows_a_sqlite_store(monkeypatch):
+    monkeypatch.delenv("WATERMARK_PATH", raising=False)
+    monkeypatch.setenv("MENTION_STORE", "dict")
+    assert default_watermark_path() is None
+
+    monkeypatch.setenv("MENTION_STORE", "sqlite")
+    monkeypatch.setenv("MENTION_DB_PATH", "/data/mentions.db")
+    assert default_watermark_path() == "/data/mentions.db.watermarks.json"
+
+    monkeypatch.setenv("WATERMARK_PATH", "/data/marks.json")
+    assert default_watermark_path() == "/data/marks.json"
@@ -11,9 +11,14 @@ interface TrendingTicker {
   total_mentions: number;
 }
 
-interface TickerHistory {
-  date: string;
-  mentions: number;
+interface TrendingDelta {
+  changed: TrendingTicker[];
+  removed: string[];
+}
+
+interface TickersHistory {
+  dates: string[];
+  tickers: Record<string, number[]>;
 }
 
 function App() {
@@ -49,6 +54,28 @@ function App() {
     fetchTrendingTickers();
   }, []);
 
+  useEffect(() => {
+    // EventSource cannot send an Authorization header, so behind basic auth
+    // the stream would 401 and reconnect forever; rely on fetches instead
+    if (Object.keys(authHeaders).length > 0) return;
+
+    const stream = new EventSource(`${API_BASE}/api/trending/stream`);
+    stream.addEventListener('snapshot', (event) => {
+      setTrendingTickers(JSON.parse((event as MessageEvent).data));
+    });
+    stream.addEventListener('delta', (event) => {
+      const delta: TrendingDelta = JSON.parse((event as MessageEvent).data);
+      setTrendingTickers(current => {
+        const byTicker = new Map(current.map(t => [t.ticker, t]));
+        delta.removed.forEach(ticker => byTicker.delete(ticker));
+        delta.changed.forEach(t => byTicker.set(t.ticker, t));
+        return Array.from(byTicker.values())
+          .sort((a, b) => b.total_mentions - a.total_mentions);
+      });
+    });
+    return () => stream.close();
+  }, []);
+
   const fetchTrendingTickers = async () => {
     try {
       setLoading(true);
@@ -71,26 +98,28 @@ function App() {
   };
 
   const updateChartData = async (tickers: string[]) => {
+    if (tickers.length === 0) {
+      setChartData([]);
+      return;
+    }
     try {
-      const historyPromises = tickers.map(ticker =>
-        fetch(`${API_BASE}/api/ticker/${ticker}/history`, {
-          headers: authHeaders
-        }).then(r => r.json())
-      );
-      
-      const histories = await Promise.all(historyPromises);
-      
-      const dateMap = new Map();
-      histories.forEach(history => {
-        history.history.forEach((point: TickerHistory) => {
-          if (!dateMap.has(point.date)) {
-            dateMap.set(point.date, { date: point.date });
-          }
-          dateMap.get(point.date)[history.ticker] = point.mentions;
+      const response = await fetch(`${API_BASE}/api/tickers/history`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          ...authHeaders
+        },
+        body: JSON.stringify({ tickers })
+      });
+      const history: TickersHistory = await response.json();
+
+      const chartData = history.dates.map((date, i) => {
+        const point: Record<string, string | number> = { date };
+        Object.entries(history.tickers).forEach(([ticker, counts]) => {
+          point[ticker] = counts[i];
         });
+        return point;
       });
-      
-      const chartData = Array.from(dateMap.values()).sort((a, b) => a.date.localeCompare(b.date));
       setChartData(chartData);
     } catch (err) {
       setError('Failed to fetch ticker history');
@@ -141,9 +170,21 @@ function App() {
     try {
       setLoading(true);
       setError('');
-      await fetch(`${API_BASE}/api/data/refresh`, {
+      const response = await fetch(`${API_BASE}/api/data/refresh`, {
+        method: 'POST',
         headers: authHeaders
       });
+      let job = await response.json();
+      while (job.status === 'queued' || job.status === 'running') {
+        await new Promise(resolve => setTimeout(resolve, 2000));
+        const status = await fetch(`${API_BASE}/api/data/refresh/${job.job_id}`, {
+          headers: authHeaders
+        });
+        job = await status.json();
+      }
+      if (job.status === 'failed') {
+        throw new Error(job.error);
+      }
       await fetchTrendingTickers();
     } catch (err) {
       setError('Failed to refresh data');
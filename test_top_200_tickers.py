@@ -11,35 +11,11 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'reddit-stock-tracker-ba
 
 from app.services.ticker_extractor import TickerExtractor
 from app.services.data_processor import DataProcessor
+from app.services.ticker_universe import get_ticker_universe
 
 def load_top_200_tickers() -> List[str]:
     """Load the top 200 tickers from our research"""
-    top_200_tickers = [
-        "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "NVDA", "TSLA", "META", "BRK.B", "BRK.A",
-        "V", "JPM", "JNJ", "WMT", "PG", "UNH", "HD", "MA", "BAC", "XOM",
-        "ORCL", "CVX", "LLY", "ABBV", "KO", "AVGO", "PEP", "COST", "TMO", "MRK",
-        "ACN", "CSCO", "ABT", "DHR", "TXN", "VZ", "ADBE", "NKE", "CRM", "WFC",
-        "NFLX", "DIS", "INTC", "AMD", "CMCSA", "PFE", "PM", "RTX", "NEE", "UPS",
-        "T", "LOW", "QCOM", "HON", "UNP", "MS", "CAT", "GS", "IBM", "AMGN",
-        "BLK", "AXP", "DE", "SPGI", "BKNG", "MDT", "ADP", "GILD", "LRCX", "TJX",
-        "VRTX", "SYK", "SCHW", "C", "ZTS", "MMC", "CB", "MO", "USB", "PYPL",
-        "SO", "PNC", "AON", "DUK", "CSX", "TMUS", "FCX", "BMY", "NOW", "AMAT",
-        "SHW", "MU", "ICE", "GE", "CME", "TGT", "REGN", "APD", "EOG", "NSC",
-        "KLAC", "SLB", "MDLZ", "ADI", "ISRG", "CI", "CMG", "FISV", "TFC", "MCD",
-        "CVS", "EMR", "BSX", "ITW", "WM", "GD", "MCO", "FDX", "NOC", "EQIX",
-        "APH", "ECL", "PSA", "CL", "WELL", "PLD", "EL", "MCHP", "HUM", "CTAS",
-        "FAST", "PAYX", "ROST", "ODFL", "VRSK", "EXC", "KMB", "CTSH", "GWW", "IDXX",
-        "YUM", "BIIB", "KHC", "DXCM", "EA", "SBUX", "MNST", "EW", "ILMN", "WBA",
-        "CSGP", "ANSS", "ZBH", "CPRT", "MKTX", "WLTW", "CDNS", "SNPS", "MAR", "ROP",
-        "FTNT", "ADSK", "A", "MSCI", "EXR", "PCAR", "CMI", "NXPI", "ORLY", "AZO",
-        "DLTR", "EBAY", "CHTR", "XLNX", "ALGN", "MXIM", "SWKS", "INCY", "SIRI", "WDC",
-        "NTAP", "VIAC", "DISH", "FOXA", "FOX", "GME", "AMC", "PLTR", "BB", "NOK",
-        "COIN", "HOOD", "RBLX", "SNOW", "MSTR", "RIOT", "MARA", "TSM", "ASML", "NVO",
-        "SHOP", "SQ", "ROKU", "PINS", "SNAP", "TWTR", "UBER", "LYFT", "ABNB", "DASH",
-        "ZM", "PTON", "DOCU", "CRWD", "OKTA", "DDOG", "NET", "TWLO", "SPLK", "WDAY",
-        "VEEV", "ZS", "PANW", "TEAM", "MDB", "ESTC", "FSLY", "FVRR", "UPWK", "ETSY",
-        "SPOT", "BABA", "JD", "PDD", "NIO", "XPEV", "LI"
-    ]
+    top_200_tickers = list(get_ticker_universe().tickers)
     return top_200_tickers
 
 def test_ticker_validation(tickers: List[str]) -> Tuple[List[str], List[str]]:
@@ -64,7 +40,7 @@ def test_mock_data_coverage(tickers: List[str]) -> Tuple[List[str], List[str]]:
     print("Testing mock data coverage...")
     
     processor = DataProcessor()
-    processor._initialize_mock_data()
+    processor.seed_mock_data()
     
     covered_tickers = []
     missing_tickers = []
@@ -90,37 +66,41 @@ async def test_api_endpoints(tickers: List[str], base_url: str = "http://localho
         'api_errors': []
     }
     
+    batch = tickers[:20]  # Test first 20 to avoid overwhelming the API
     async with aiohttp.ClientSession() as session:
-        for ticker in tickers[:20]:  # Test first 20 to avoid overwhelming the API
-            try:
-                async with session.post(
-                    f"{base_url}/api/ticker/validate",
-                    json={"ticker": ticker}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('valid', False):
-                            results['validation_passed'].append(ticker)
+        try:
+            async with session.post(
+                f"{base_url}/api/tickers/validate",
+                json={"tickers": batch}
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    for result in data['results']:
+                        if result['valid']:
+                            results['validation_passed'].append(result['ticker'])
                         else:
-                            results['validation_failed'].append(ticker)
-                    else:
-                        results['api_errors'].append(f"{ticker}: HTTP {response.status}")
-            except Exception as e:
-                results['api_errors'].append(f"{ticker}: {str(e)}")
-        
-        for ticker in tickers[:20]:  # Test first 20 to avoid overwhelming the API
-            try:
-                async with session.get(f"{base_url}/api/ticker/{ticker}/history") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('history') and len(data['history']) > 0:
+                            results['validation_failed'].append(result['ticker'])
+                else:
+                    results['api_errors'].append(f"validate: HTTP {response.status}")
+        except Exception as e:
+            results['api_errors'].append(f"validate: {str(e)}")
+
+        try:
+            async with session.post(
+                f"{base_url}/api/tickers/history",
+                json={"tickers": batch}
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    for ticker, counts in data['tickers'].items():
+                        if any(counts):
                             results['history_available'].append(ticker)
                         else:
                             results['history_missing'].append(ticker)
-                    else:
-                        results['api_errors'].append(f"{ticker} history: HTTP {response.status}")
-            except Exception as e:
-                results['api_errors'].append(f"{ticker} history: {str(e)}")
+                else:
+                    results['api_errors'].append(f"history: HTTP {response.status}")
+        except Exception as e:
+            results['api_errors'].append(f"history: {str(e)}")
     
     return results
 